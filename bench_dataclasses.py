@@ -0,0 +1,190 @@
+"""
+Compare udataclasses with stdlib dataclasses on SceneBase-like classes.
+
+`libthree.py` uses stdlib dataclasses on Pyodide and udataclasses on
+MicroPython. This measures, for each implementation available to the
+interpreter, how long it takes to create the class, construct an
+instance, read and write fields and `replace()` an instance. Results go
+to stdout as JSON, one object per implementation and class shape:
+
+    python bench_dataclasses.py > pyodide.json
+    micropython bench_dataclasses.py > micropython.json
+
+Times are in microseconds, per class, instance, field access or call.
+"""
+
+import json
+import sys
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us():
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+sys.path.insert(0, "tutorial9/glue")
+
+import udataclasses
+
+ROUNDS = 100
+INSTANCES = 2000
+ACCESSES = 20000
+
+
+def define_scene(dataclass, field):
+    # The shape of tutorial 9's GLTFModels: SceneBase fields plus its own.
+    @dataclass
+    class GLTFModels:
+        scene: object = field(default=None)
+        renderer: object = field(default=None)
+        camera: object = field(default=None)
+        view_size: int = field(default=50)
+        controls: object = field(init=False)
+        stats: object = field(init=False)
+        clock: object = field(default=None)
+        render_mode: str = field(default="continuous")
+        tick_rate: float = field(default=None)
+        max_steps: int = field(default=5)
+        point_light: object = field(init=False)
+        spot_light: object = field(init=False)
+        python_logo: object = field(default=None)
+        flamingo: object = field(default=None)
+        flamingo_clips: list = field(default_factory=list)
+        flamingo_animation: object = field(default=None)
+        loading_manager: object = field(init=False)
+        gltf_loader: object = field(init=False)
+
+        def __post_init__(self):
+            self.controls = None
+            self.stats = None
+            self.point_light = None
+            self.spot_light = None
+            self.loading_manager = None
+            self.gltf_loader = None
+
+    return GLTFModels
+
+
+def define_snapshot(dataclass, field):
+    # A per-frame state snapshot, the kind of class replace() is used on.
+    @dataclass
+    class FrameState:
+        frame: int = field(default=0)
+        now: float = field(default=0.0)
+        delta: float = field(default=0.0)
+        alpha: float = field(default=0.0)
+        view_size: int = field(default=50)
+        pixel_ratio: float = field(default=1.0)
+        camera_moved: bool = field(default=False)
+        shadows_dirty: bool = field(default=False)
+        visible: tuple = field(default=())
+        selection: list = field(default_factory=list)
+
+    return FrameState
+
+
+SHAPES = {"scene": define_scene, "snapshot": define_snapshot}
+
+
+def implementations():
+    """(name, dataclass, field, replace) for every usable implementation."""
+    found = []
+    try:
+        import dataclasses
+    except ImportError:
+        pass  # MicroPython
+    else:
+        found.append(
+            ("stdlib", dataclasses.dataclass, dataclasses.field, dataclasses.replace)
+        )
+    found.append(
+        ("udataclasses", udataclasses.dataclass, udataclasses.field, udataclasses.replace)
+    )
+
+    def fast_attrs(cls):
+        return udataclasses.dataclass(cls, fast_attrs=True)
+
+    found.append(
+        ("udataclasses_fast_attrs", fast_attrs, udataclasses.field, udataclasses.replace)
+    )
+    return found
+
+
+def timed(function, rounds):
+    start = ticks_us()
+    function(rounds)
+    return ticks_diff(ticks_us(), start) / rounds
+
+
+def bench_shape(define, dataclass, field, replace):
+    def create(rounds):
+        for _ in range(rounds):
+            # As on page load, where each class is only defined once.
+            udataclasses.clear_code_cache()
+            define(dataclass, field)
+
+    cls = define(dataclass, field)
+    obj = cls()
+
+    def construct(rounds):
+        for _ in range(rounds):
+            cls()
+
+    def read(rounds):
+        o = obj
+        for _ in range(rounds // 4):
+            o.view_size
+            o.view_size
+            o.view_size
+            o.view_size
+
+    def write(rounds):
+        o = obj
+        for _ in range(rounds // 4):
+            o.view_size = 1
+            o.view_size = 2
+            o.view_size = 3
+            o.view_size = 4
+
+    def loop(rounds):
+        for _ in range(rounds // 4):
+            pass
+
+    def copy(rounds):
+        for _ in range(rounds):
+            replace(obj, view_size=10)
+
+    empty = timed(loop, ACCESSES)
+    return {
+        "fields": len(cls.__dataclass_fields__),
+        "create_us": timed(create, ROUNDS),
+        "construct_us": timed(construct, INSTANCES),
+        "read_us": timed(read, ACCESSES) - empty,
+        "write_us": timed(write, ACCESSES) - empty,
+        "replace_us": timed(copy, INSTANCES),
+    }
+
+
+def main():
+    results = []
+    for name, dataclass, field, replace in implementations():
+        for shape, define in SHAPES.items():
+            result = {
+                "interpreter": sys.implementation.name,
+                "implementation": name,
+                "shape": shape,
+            }
+            result.update(bench_shape(define, dataclass, field, replace))
+            results.append(result)
+    for result in results:
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
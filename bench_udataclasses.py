@@ -0,0 +1,135 @@
+"""
+Measure how long udataclasses takes to turn a class into a dataclass.
+
+Compares compiling every generated method with a separate `exec()` (how
+udataclasses used to work) against compiling the whole class at once,
+with and without the compiled code cache shared by classes with the same
+field layout.
+Run from the repository root with either interpreter:
+
+    python bench_udataclasses.py
+    micropython bench_udataclasses.py
+"""
+
+import sys
+
+try:
+    from time import ticks_us, ticks_diff
+except ImportError:
+    from time import perf_counter_ns
+
+    def ticks_us():
+        return perf_counter_ns() // 1000
+
+    def ticks_diff(end, start):
+        return end - start
+
+
+sys.path.insert(0, "tutorial9/glue")
+
+import udataclasses
+from udataclasses import field
+
+ROUNDS = 200
+
+
+def make_methods_per_method(transform):
+    """udataclasses.make_methods as it was, one exec per generated method."""
+    global_bindings = udataclasses.make_global_bindings(transform)
+    methods = {}
+
+    def add_method(code):
+        exec(code, global_bindings, methods)
+
+    for f in transform.fields:
+        add_method(udataclasses._getter(f))
+        add_method(udataclasses._setter(f, transform.frozen))
+        add_method(udataclasses._deleter(f, transform.frozen))
+
+    if transform.init:
+        add_method(udataclasses._init(transform.fields, post_init=transform.post_init))
+    if transform.repr:
+        add_method(udataclasses._repr(transform.fields))
+    if transform.eq:
+        add_method(udataclasses._eq(transform.fields))
+    if transform.order:
+        add_method(udataclasses._lt(transform.fields))
+        add_method(udataclasses._le(transform.fields))
+        add_method(udataclasses._gt(transform.fields))
+        add_method(udataclasses._ge(transform.fields))
+
+    if transform.hash is None:
+        methods["__hash__"] = None
+    if transform.hash:
+        add_method(udataclasses._hash(transform.fields))
+
+    return methods
+
+
+def make_methods_uncached(transform):
+    udataclasses.clear_code_cache()
+    return original_make_methods(transform)
+
+
+original_make_methods = udataclasses.make_methods
+
+
+def define_class():
+    # The shape of tutorial 9's GLTFModels: SceneBase fields plus its own.
+    class GLTFModels:
+        scene = field(default=None)
+        renderer = field(default=None)
+        camera = field(default=None)
+        view_size = field(default=50)
+        controls = field(init=False)
+        stats = field(init=False)
+        clock = field(default=None)
+        point_light = field(init=False)
+        spot_light = field(init=False)
+        python_logo = field(default=None)
+        flamingo = field(default=None)
+        flamingo_clips = field(default=None)
+        flamingo_animation = field(default=None)
+        loading_manager = field(init=False)
+        loaded_event = field(init=False)
+        texture_loader = field(init=False)
+        gltf_loader = field(init=False)
+
+        def __post_init__(self):
+            pass
+
+    return GLTFModels
+
+
+def bench(make_methods):
+    original = udataclasses.make_methods
+    udataclasses.make_methods = make_methods
+    try:
+        start = ticks_us()
+        for _ in range(ROUNDS):
+            udataclasses.dataclass(define_class())
+        return ticks_diff(ticks_us(), start) / ROUNDS
+    finally:
+        udataclasses.make_methods = original
+
+
+def main():
+    start = ticks_us()
+    for _ in range(ROUNDS):
+        define_class()
+    baseline = ticks_diff(ticks_us(), start) / ROUNDS
+
+    before = bench(make_methods_per_method) - baseline
+    after = bench(make_methods_uncached) - baseline
+    udataclasses.clear_code_cache()
+    cached = bench(udataclasses.make_methods) - baseline
+    info = udataclasses.code_cache_info()
+    print(f"exec per method: {before:10.1f} us per class")
+    print(f"exec per class:  {after:10.1f} us per class")
+    print(f"cached code:     {cached:10.1f} us per class")
+    print(f"speedup:         {before / after:10.2f}x, {before / cached:.2f}x cached")
+    print(f"cache:           {info['hits']} hits, {info['misses']} misses")
+
+
+if __name__ == "__main__":
+    main()
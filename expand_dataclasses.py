@@ -0,0 +1,347 @@
+"""
+Expand udataclasses ahead of time, so pages don't generate code on load.
+
+On MicroPython every `@dataclass` runs udataclasses' code generation and
+`exec()` on each page load. This writes a copy of the given modules with
+the generated `__init__`, accessors and comparison methods inlined as
+ordinary source code in the class body, and the decorator removed.
+Pass modules in dependency order, so base classes from earlier modules
+are known when expanding later ones:
+
+    python expand_dataclasses.py tutorial9/libthree.py tutorial9/main.py -o build
+
+The modules are parsed, not imported: they need `pyscript`, which only
+exists in the browser. Only top-level classes are expanded. The expanded
+modules still import `Field` and friends from udataclasses, so
+`fields()` and `replace()` keep working.
+"""
+
+import argparse
+import ast
+from pathlib import Path
+import sys
+
+CURRENT_DIR = Path(__file__).parent
+sys.path.insert(0, str(CURRENT_DIR / "tutorial9" / "glue"))
+
+import udataclasses
+from udataclasses import MISSING, Field, TransformSpec
+
+PRESENT = object()  # stands in for a default only known at runtime
+DECORATOR_FLAGS = ("init", "repr", "eq", "order", "unsafe_hash", "frozen", "fast_attrs")
+FIELD_FLAGS = ("init", "repr", "hash", "compare", "lazy")
+FIELD_FLAG_DEFAULTS = {"hash": None, "lazy": False}
+
+
+class SourceField(Field):
+    """A field whose default lives in a module-level binding in the output."""
+
+    cls_name: str = ""
+    default_source: str | None = None
+    factory_source: str | None = None
+
+    @property
+    def default_value_name(self) -> str:
+        return f"_{self.cls_name}_default_{self.name}"
+
+    def bind_to(self, cls_name: str) -> "SourceField":
+        clone = SourceField(
+            self.name,
+            default=self.default,
+            default_factory=self.default_factory,
+            init=self.init,
+            repr=self.repr,
+            hash=self.hash,
+            compare=self.compare,
+            lazy=self.lazy,
+        )
+        clone.cls_name = cls_name
+        clone.default_source = self.default_source
+        clone.factory_source = self.factory_source
+        return clone
+
+    def copy(self) -> "SourceField":
+        clone = self.bind_to(self.cls_name)
+        clone.plain_attr = self.plain_attr
+        return clone
+
+
+class ClassInfo:
+    """What later modules need to know about an expanded dataclass."""
+
+    def __init__(self, fields: dict, post_init: bool, fast_attrs: bool) -> None:
+        self.fields = fields
+        self.post_init = post_init
+        self.fast_attrs = fast_attrs
+
+
+def decorator_flags(node: ast.ClassDef) -> dict | None:
+    """Keyword arguments of the @dataclass decorator, None if there's none."""
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Name) and decorator.id == "dataclass":
+            return {}
+        if (
+            isinstance(decorator, ast.Call)
+            and isinstance(decorator.func, ast.Name)
+            and decorator.func.id == "dataclass"
+        ):
+            flags = {}
+            for kw in decorator.keywords:
+                if kw.arg not in DECORATOR_FLAGS:
+                    raise ValueError(f"line {decorator.lineno}: unsupported {kw.arg}=")
+                flags[kw.arg] = ast.literal_eval(kw.value)
+            return flags
+    return None
+
+
+def field_from_statement(stmt: ast.stmt, source: str) -> SourceField | None:
+    """The field declared by a class body statement, mirroring TransformSpec."""
+    if isinstance(stmt, ast.AnnAssign):
+        target, value = stmt.target, stmt.value
+    elif isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+        target, value = stmt.targets[0], stmt.value
+    else:
+        return None
+    if not isinstance(target, ast.Name) or value is None:
+        # udataclasses can't see bare annotations, neither can we.
+        return None
+    name = target.id
+    if name.startswith("__") or isinstance(value, ast.Lambda):
+        return None
+    if (
+        isinstance(value, ast.Call)
+        and isinstance(value.func, ast.Name)
+        and value.func.id in ("staticmethod", "classmethod", "property")
+    ):
+        return None
+
+    field = SourceField(name)
+    if (
+        isinstance(value, ast.Call)
+        and isinstance(value.func, ast.Name)
+        and value.func.id == "field"
+    ):
+        for kw in value.keywords:
+            if kw.arg == "default":
+                field.default = PRESENT
+                field.default_source = ast.get_source_segment(source, kw.value)
+            elif kw.arg == "default_factory":
+                field.default_factory = PRESENT
+                field.factory_source = ast.get_source_segment(source, kw.value)
+            elif kw.arg in FIELD_FLAGS:
+                setattr(field, kw.arg, ast.literal_eval(kw.value))
+            else:
+                raise ValueError(f"line {stmt.lineno}: unsupported field({kw.arg}=)")
+        given = {kw.arg for kw in value.keywords}
+        # As in udataclasses.field(), lazy fields default to repr and
+        # compare off.
+        if field.lazy:
+            for flag in ("repr", "compare"):
+                if flag not in given:
+                    setattr(field, flag, False)
+    else:
+        field.default = PRESENT
+        field.default_source = ast.get_source_segment(source, value)
+    return field
+
+
+def stand_in_method(self):
+    pass
+
+
+def indent(code: str, prefix: str) -> list[str]:
+    return [prefix + line if line else line for line in code.split("\n")]
+
+
+class Expander:
+    def __init__(self) -> None:
+        self.classes: dict[str, ClassInfo] = {}
+
+    def expand(self, source: str, path: str) -> str:
+        tree = ast.parse(source)
+        lines = source.split("\n")
+        # Replacements as (first line, last line, new lines), 0-based inclusive.
+        edits: list[tuple[int, int, list[str]]] = []
+        first_class_line = None
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            flags = decorator_flags(node)
+            if flags is None:
+                continue
+            start = min(d.lineno for d in node.decorator_list) - 1
+            if first_class_line is None:
+                first_class_line = start
+            edits.append((start, node.end_lineno - 1, self.expand_class(node, flags, source, lines, path)))
+
+        for start, end, new_lines in reversed(edits):
+            lines[start : end + 1] = new_lines
+        if first_class_line is not None:
+            lines[first_class_line:first_class_line] = [
+                "from udataclasses import (",
+                "    FACTORY_SENTINEL,",
+                "    FrozenInstanceError,",
+                "    Field,",
+                "    LazyField,",
+                "    check_changes,",
+                "    store_fields,",
+                ")",
+                "",
+            ]
+        return "\n".join(lines)
+
+    def expand_class(self, node, flags, source, lines, path) -> list[str]:
+        name = node.name
+        own_fields: dict[str, SourceField] = {}
+        field_lines: set[int] = set()
+        methods = set()
+        for stmt in node.body:
+            field = field_from_statement(stmt, source)
+            if field is not None:
+                own_fields[field.name] = field
+                first = stmt.lineno - 1
+                # Comments right above a field are about the field.
+                while lines[first - 1].lstrip().startswith("#"):
+                    first -= 1
+                field_lines.update(range(first, stmt.end_lineno))
+            elif isinstance(stmt, ast.FunctionDef | ast.AsyncFunctionDef):
+                methods.add(stmt.name)
+
+        base_fields: dict[str, SourceField] = {}
+        owners: dict[str, str] = {}  # inherited field name: base class name
+        base_post_init = False
+        base_fast_attrs = False
+        for base in node.bases:
+            base_name = ast.get_source_segment(source, base)
+            info = self.classes.get(base_name)
+            if info is None:
+                print(
+                    f"{path}:{node.lineno}: base {base_name} of {name} isn't a known"
+                    " dataclass, pass its module first if it is one",
+                    file=sys.stderr,
+                )
+                continue
+            base_fields.update(info.fields)
+            for field_name in info.fields:
+                owners[field_name] = base_name
+            base_post_init = base_post_init or info.post_init
+            base_fast_attrs = base_fast_attrs or info.fast_attrs
+
+        fast_attrs = flags.get("fast_attrs")
+        if fast_attrs is None:
+            fast_attrs = base_fast_attrs
+        if fast_attrs and flags.get("frozen"):
+            raise ValueError(f"{path}:{node.lineno}: fast_attrs can't be frozen")
+
+        # Let udataclasses decide what to generate, from stand-in classes
+        # that look like the real ones.
+        stand_in_base = type("Base", (), {udataclasses.FIELDS_NAME: base_fields})
+        if base_post_init:
+            stand_in_base.__post_init__ = stand_in_method
+        namespace = dict(own_fields)
+        for method in methods:
+            namespace[method] = stand_in_method
+        stand_in = type(name, (stand_in_base,), namespace)
+        transform = TransformSpec(
+            stand_in,
+            init=flags.get("init", True),
+            repr=flags.get("repr", True),
+            eq=flags.get("eq", True),
+            order=flags.get("order", False),
+            unsafe_hash=flags.get("unsafe_hash", False),
+            frozen=flags.get("frozen", False),
+            fast_attrs=fast_attrs,
+        )
+        transform.fields = [f.bind_to(name) for f in transform.fields]
+        for field in transform.fields:
+            field.plain_attr = fast_attrs
+
+        out: list[str] = []
+        # Own defaults in source order, they may have side effects.
+        by_name = {f.name: f for f in transform.fields}
+        ordered = [by_name[n] for n in own_fields if n in by_name]
+        ordered += [f for f in transform.fields if f.name not in own_fields]
+        for field in ordered:
+            if field.default is MISSING and field.default_factory is MISSING:
+                continue
+            if field.name in own_fields:
+                value = field.factory_source or field.default_source
+            else:
+                attr = "default" if field.default is not MISSING else "default_factory"
+                owner = owners[field.name]
+                value = f'{owner}.{udataclasses.FIELDS_NAME}["{field.name}"].{attr}'
+            out.append(f"{field.default_value_name} = {value}")
+        if out:
+            out.extend(("", ""))
+
+        body_start = node.body[0].lineno - 1
+        out.extend(lines[node.lineno - 1 : body_start])
+        prefix = " " * node.body[0].col_offset
+        body = [
+            line
+            for number, line in enumerate(lines[body_start : node.end_lineno], body_start)
+            if number not in field_lines
+        ]
+        while body and not body[-1].strip():
+            body.pop()
+        while body and not body[0].strip():
+            body.pop(0)
+        out.extend(body)
+
+        generated = udataclasses.make_source(transform)
+        if transform.hash is None:
+            generated += "\n__hash__ = None"
+        if generated:
+            if body:
+                out.append("")
+            out.extend(indent(generated, prefix))
+        elif not any(line.strip() for line in body):
+            out.append(prefix + "pass")
+
+        out.append("")
+        out.append("")
+        out.append(f"store_fields({name}, [")
+        for field in transform.fields:
+            args = [f'"{field.name}"']
+            if field.default is not MISSING:
+                args.append(f"default={field.default_value_name}")
+            if field.default_factory is not MISSING:
+                args.append(f"default_factory={field.default_value_name}")
+            for flag in FIELD_FLAGS:
+                value = getattr(field, flag)
+                if value != FIELD_FLAG_DEFAULTS.get(flag, True):
+                    args.append(f"{flag}={value!r}")
+            out.append(f'    Field({", ".join(args)}),')
+        out.append("])")
+        out.append(f"{name}.{udataclasses.FAST_ATTRS_NAME} = {fast_attrs!r}")
+        for field in transform.fields:
+            if field.lazy:
+                out.append(
+                    f'{name}.{field._name} = LazyField("{field._name}", {field.default_value_name})'
+                )
+
+        self.classes[name] = ClassInfo(
+            {f.name: f for f in transform.fields},
+            post_init=hasattr(stand_in, "__post_init__"),
+            fast_attrs=fast_attrs,
+        )
+        return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n")[0])
+    parser.add_argument("modules", nargs="+", type=Path)
+    parser.add_argument("-o", "--output-dir", type=Path, default=Path("build"))
+    args = parser.parse_args()
+
+    expander = Expander()
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    for path in args.modules:
+        expanded = expander.expand(path.read_text(), str(path))
+        target = args.output_dir / path.name
+        target.write_text(expanded)
+        print(target)
+
+
+if __name__ == "__main__":
+    main()
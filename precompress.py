@@ -0,0 +1,66 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "brotli",
+# ]
+# ///
+"""
+Write `.br` and `.gz` siblings of the files in bundle/, for server.py.
+
+server.py serves a sibling instead of the file itself when the browser
+accepts its encoding. Compressing ahead of time lets us use the slowest,
+best settings. Siblings that wouldn't save at least a tenth of the size
+aren't written, up to date ones are skipped. Run after updating bundle/:
+
+    uv run precompress.py [directory ...]
+"""
+
+import gzip
+from pathlib import Path
+import sys
+
+import brotli
+
+CURRENT_DIR = Path(__file__).parent
+MIN_SIZE = 1024
+MAX_RATIO = 0.9
+# Formats that are compressed already.
+SKIP_SUFFIXES = {
+    ".br", ".gz", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ktx2", ".basis",
+    ".mp3", ".mp4", ".ogg", ".woff2",
+}
+ENCODERS = {
+    ".br": lambda data: brotli.compress(data, quality=11),
+    ".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+}
+
+
+def precompress(path: Path) -> None:
+    data = path.read_bytes()
+    mtime = path.stat().st_mtime
+    for suffix, encode in ENCODERS.items():
+        sibling = path.with_name(path.name + suffix)
+        if sibling.exists() and sibling.stat().st_mtime >= mtime:
+            continue
+        encoded = encode(data)
+        if len(encoded) > len(data) * MAX_RATIO:
+            sibling.unlink(missing_ok=True)
+            continue
+        sibling.write_bytes(encoded)
+        print(f"{sibling} {len(data)} -> {len(encoded)} bytes")
+
+
+def main() -> None:
+    directories = [Path(d) for d in sys.argv[1:]] or [CURRENT_DIR / "bundle"]
+    for directory in directories:
+        for path in sorted(directory.rglob("*")):
+            if (
+                path.is_file()
+                and path.suffix not in SKIP_SUFFIXES
+                and path.stat().st_size >= MIN_SIZE
+            ):
+                precompress(path)
+
+
+if __name__ == "__main__":
+    main()
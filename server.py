@@ -5,62 +5,227 @@
 #     "uvicorn",
 # ]
 # ///
+import hashlib
+import mimetypes
 import os
+import re
 import sys
 
 from starlette.applications import Starlette
 from starlette.routing import Mount
-from starlette.staticfiles import StaticFiles
+from starlette.staticfiles import StaticFiles, NotModifiedResponse
 from starlette.middleware import Middleware
 from starlette.middleware.cors import CORSMiddleware
-from starlette.datastructures import MutableHeaders
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 import uvicorn
 
 
-class CrossOriginEmbedderPolicy:
-    def __init__(self, app: ASGIApp) -> None:
+# Sent locally on top of the `_headers` file: the page has to be cross-origin
+# isolated for SharedArrayBuffer, which PyScript workers need. Later rules
+# override earlier ones setting the same header.
+LOCAL_HEADERS = """
+/*
+  Cross-Origin-Embedder-Policy: credentialless
+  Cross-Origin-Opener-Policy: same-origin
+"""
+
+HeaderRule = tuple[re.Pattern, list[tuple[bytes, bytes]]]
+
+
+def parse_headers(text: str) -> list[HeaderRule]:
+    """Parse a Netlify-style `_headers` file.
+
+    A rule is a path pattern followed by indented `Name: value` lines. In
+    patterns `*` matches anything and `:name` a single path segment.
+    """
+    rules: list[HeaderRule] = []
+    for number, line in enumerate(text.splitlines(), 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line[0].isspace():
+            pattern = re.escape(line.strip()).replace(r"\*", ".*")
+            pattern = re.sub(r":\w+", "[^/]+", pattern)
+            rules.append((re.compile(pattern + "$"), []))
+            continue
+        name, sep, value = line.strip().partition(":")
+        if not sep or not rules:
+            raise ValueError(f"_headers line {number}: expected a path or Name: value")
+        rules[-1][1].append(
+            (name.strip().lower().encode("latin-1"), value.strip().encode("latin-1"))
+        )
+    return rules
+
+
+def load_header_rules(path: str = "_headers") -> list[HeaderRule]:
+    rules = parse_headers(LOCAL_HEADERS)
+    try:
+        with open(path, encoding="utf-8") as f:
+            rules += parse_headers(f.read())
+    except FileNotFoundError:
+        pass
+    return rules
+
+
+class HeaderRules:
+    """Add the headers of every rule matching the request path."""
+
+    def __init__(self, app: ASGIApp, rules: list[HeaderRule]) -> None:
         self.app = app
+        self.rules = rules
+        # indexes of matching rules: their merged headers
+        self.merged: dict[tuple[int, ...], list[tuple[bytes, bytes]]] = {}
+
+    def headers_for(self, path: str) -> list[tuple[bytes, bytes]]:
+        key = tuple(i for i, (pattern, _) in enumerate(self.rules) if pattern.match(path))
+        headers = self.merged.get(key)
+        if headers is None:
+            by_name = {}
+            for i in key:
+                by_name.update(self.rules[i][1])
+            headers = self.merged[key] = list(by_name.items())
+        return headers
 
-    async def __call__(self, scope, receive, send):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
 
-        async def set_coep(message):
-            if message["type"] == "http.response.start":
-                headers = MutableHeaders(scope=message)
-                headers.append('Cross-Origin-Embedder-Policy', "credentialless")
-            await send(message)
-
-        await self.app(scope, receive, set_coep)
-
-
-class CrossOriginOpenerPolicy:
-    def __init__(self, app: ASGIApp) -> None:
-        self.app = app
-
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
+        extra = self.headers_for(scope["path"])
+        if not extra:
             return await self.app(scope, receive, send)
 
-        async def set_coop(message):
+        async def send_with_headers(message):
             if message["type"] == "http.response.start":
-                headers = MutableHeaders(scope=message)
-                headers.append('Cross-Origin-Opener-Policy', "same-origin")
+                message["headers"] = [*message["headers"], *extra]
             await send(message)
 
-        await self.app(scope, receive, set_coop)
+        await self.app(scope, receive, send_with_headers)
+
+
+# Content-Encoding and file suffix of precompressed siblings, written by
+# precompress.py, in order of preference.
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def accepted_encodings(headers: Headers) -> set[str]:
+    accepted = set()
+    for item in headers.get("accept-encoding", "").split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip().lower())
+    if "*" in accepted:
+        accepted.update(encoding for encoding, _ in ENCODINGS)
+    return accepted
+
+
+# Files under bundle/ whose name changes with their content: Vite chunks
+# with a content hash, and wheels with a version. Everything else, like
+# pyodide.asm.js or micropython.wasm, may change under the same name when
+# the bundle is updated, so browsers revalidate it by ETag.
+IMMUTABLE_RE = re.compile(
+    r"^/bundle/.*(-[A-Za-z0-9_-]{8}\.(m?js|css)(\.map)?|\.whl(\.metadata)?)$"
+)
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+class ETagCache:
+    """Strong ETags from file contents, hashed once per file version."""
+
+    def __init__(self) -> None:
+        # path: (mtime_ns, size, etag)
+        self.entries: dict[str, tuple[int, int, str]] = {}
+
+    def get(self, path: str, stat_result: os.stat_result) -> str:
+        entry = self.entries.get(path)
+        if (
+            entry is not None
+            and entry[0] == stat_result.st_mtime_ns
+            and entry[1] == stat_result.st_size
+        ):
+            return entry[2]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        self.entries[path] = (stat_result.st_mtime_ns, stat_result.st_size, etag)
+        return etag
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles serving `name.br` or `name.gz` instead of `name` if accepted.
+
+    Also sets the caching policy: hashed bundle files are immutable, the
+    rest gets revalidated with a content hash ETag.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.etags = ETagCache()
+
+    def file_response(
+        self,
+        full_path: str,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = None
+        headers = {}
+        path = full_path
+        for encoding, suffix in ENCODINGS:
+            try:
+                sibling_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            if sibling_stat.st_mtime < stat_result.st_mtime:
+                continue  # stale, precompress.py wasn't run again
+            headers["vary"] = "Accept-Encoding"
+            if accepted is None:
+                accepted = accepted_encodings(request_headers)
+            if encoding in accepted:
+                headers["content-encoding"] = encoding
+                path = full_path + suffix
+                stat_result = sibling_stat
+                break
+        if IMMUTABLE_RE.match(scope["path"]):
+            headers["cache-control"] = IMMUTABLE
+        else:
+            headers["cache-control"] = REVALIDATE
+        headers["etag"] = self.etags.get(path, stat_result)
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=mimetypes.guess_type(full_path)[0] or "text/plain",
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
 
 
 middleware = [
     Middleware(CORSMiddleware, allow_origins=['*']),
-    Middleware(CrossOriginEmbedderPolicy),
-    Middleware(CrossOriginOpenerPolicy),
+    # Inside CORSMiddleware, which replaces rather than duplicates
+    # Access-Control-Allow-Origin.
+    Middleware(HeaderRules, rules=load_header_rules()),
 ]
 
 routes = [
-    Mount('/', app=StaticFiles(html=True, directory='.'), name="static"),
+    Mount('/', app=PrecompressedStaticFiles(html=True, directory='.'), name="static"),
 ]
 
 app = Starlette(routes=routes, middleware=middleware)
@@ -5,9 +5,9 @@ import random
 
 from pyscript import window
 from pyscript import config
-from pyscript.ffi import create_proxy
+from pyscript.ffi import create_proxy, to_js
 
-from libthree import THREE, new
+from libthree import THREE, new, shared
 from libthree import get_renderer, get_perspective_camera, get_controls
 from libthree import get_stats_gl
 
@@ -28,29 +28,82 @@ controls = get_controls(camera, renderer)
 light = new(THREE.AmbientLight, 0xffffff, 2.0)
 scene.add(light)
 
-grid_size_x = 10
+# One InstancedMesh with per-instance colors draws the whole grid in
+# a single call. Set to False for one Mesh (and material) per sphere.
+INSTANCED = True
+
+grid_size_x = 10  # try 316 x 316 for 100,000 spheres with INSTANCED
 grid_size_y = 10
 spacing = 1.5
 spheres = []
 grid_center_x = grid_size_x * spacing / 2
 grid_center_y = grid_size_y * spacing / 2
+sphere_count = grid_size_x * grid_size_y
 
 print("Computing shapes", end="...")
-for x in range(grid_size_x):
-    print(end=".")
-    for y in range(grid_size_y):
-        geometry = new(THREE.SphereGeometry, 0.3, 16, 16)
-        material = new(THREE.MeshStandardMaterial, color=0x800080)
-        sphere = new(THREE.Mesh, geometry, material)
-        sphere.position.set(
-            x * spacing - grid_center_x,
-            y * spacing - grid_center_y,
-            0
-        )
-        scene.add(sphere)
-        spheres.append(sphere)
+if INSTANCED:
+    geometry = shared(THREE.SphereGeometry, 0.3, 16, 16)
+    material = new(THREE.MeshStandardMaterial, color=0xffffff)
+    grid = new(THREE.InstancedMesh, geometry, material, sphere_count)
+    # Build the whole buffers in Python and copy each to JS at once.
+    # Matrices are column-major, the translation sits in the last column.
+    matrices = []
+    colors = []
+    # instanceColor is linear, so convert from the sRGB hex of the
+    # mesh-per-sphere material instead of writing its components directly
+    purple = new(THREE.Color, 0x800080)
+    purple = (purple.r, purple.g, purple.b)
+    for x in range(grid_size_x):
+        for y in range(grid_size_y):
+            matrices.extend((
+                1, 0, 0, 0,
+                0, 1, 0, 0,
+                0, 0, 1, 0,
+                x * spacing - grid_center_x, y * spacing - grid_center_y, 0, 1,
+            ))
+            colors.extend(purple)
+    grid.instanceMatrix.array.set(to_js(matrices))
+    grid.instanceMatrix.needsUpdate = True
+    grid.instanceColor = new(
+        THREE.InstancedBufferAttribute,
+        new(window.Float32Array, to_js(colors)),
+        3,
+    )
+    grid.instanceColor.setUsage(THREE.DynamicDrawUsage)
+    grid.computeBoundingSphere()
+    scene.add(grid)
+    del matrices, colors
+else:
+    for x in range(grid_size_x):
+        print(end=".")
+        for y in range(grid_size_y):
+            geometry = shared(THREE.SphereGeometry, 0.3, 16, 16)
+            # not shared, animate() below recolors spheres one by one
+            material = new(THREE.MeshStandardMaterial, color=0x800080)
+            sphere = new(THREE.Mesh, geometry, material)
+            sphere.position.set(
+                x * spacing - grid_center_x,
+                y * spacing - grid_center_y,
+                0
+            )
+            scene.add(sphere)
+            spheres.append(sphere)
 print("done!")
 
+# Instanced mode recolors a run of consecutive spheres per frame, so it's
+# one write into the color buffer and one partial upload to the GPU.
+recolor_per_frame = max(1, sphere_count // 100)
+
+
+def recolor_instances():
+    start = random.randrange(sphere_count - recolor_per_frame + 1)
+    values = [random.random() for _ in range(recolor_per_frame * 3)]
+    colors = grid.instanceColor
+    colors.array.set(to_js(values), start * 3)
+    colors.clearUpdateRanges()
+    colors.addUpdateRange(start * 3, len(values))
+    colors.needsUpdate = True
+
 @create_proxy
 def on_window_resize(event):
     aspect_ratio = window.innerWidth / window.innerHeight
@@ -71,11 +124,14 @@ window.addEventListener("resize", on_window_resize)
 
 @create_proxy
 def animate(now=0.0):
-    random.choice(spheres).material.color.setRGB(
-        random.random(),
-        random.random(),
-        random.random(),
-    )
+    if INSTANCED:
+        recolor_instances()
+    else:
+        random.choice(spheres).material.color.setRGB(
+            random.random(),
+            random.random(),
+            random.random(),
+        )
     controls.update()
     renderer.render(scene, camera)
     stats_gl.update()
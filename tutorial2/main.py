@@ -7,7 +7,7 @@ from pyscript import document, window
 from pyscript import config
 from pyscript.ffi import create_proxy
 
-from libthree import THREE, new, clear
+from libthree import THREE, new, shared, clear
 from libthree import get_renderer, get_perspective_camera, get_controls
 from libthree import get_stats_gl
 
@@ -41,7 +41,8 @@ def make_scene_grid():
     for x in range(grid_size_x):
         print(end=".")
         for y in range(grid_size_y):
-            geometry = new(THREE.SphereGeometry, x/grid_size_x * 0.5, 16, 16)
+            geometry = shared(THREE.SphereGeometry, x/grid_size_x * 0.5, 16, 16)
+            # not shared, animate() below recolors spheres one by one
             material = new(THREE.MeshStandardMaterial, color=0x800080)
             sphere = new(THREE.Mesh, geometry, material)
             sphere.position.set(
@@ -25,6 +25,42 @@ else:
     def call(obj, *args, **kwargs):
         return obj(*args, **kwargs)
 
+# shared instances by repr((constructor name, args, kwargs)): [instance, refcount]
+# The key is also kept in the instance's userData.shared for release_shared().
+_shared = {}
+
+def shared(obj, *args, **kwargs):
+    """Like `new()` but returns one shared instance per distinct arguments.
+
+    Meant for geometries and materials that many meshes can reuse. Arguments
+    must be hashable. Objects you're going to mutate (e.g. a material whose
+    color changes per mesh) must not be shared, create those with `new()`.
+    Every call takes a reference, give it back with `release_shared()`.
+    """
+    key = repr((obj.name, args, tuple(sorted(kwargs.items()))))
+    entry = _shared.get(key)
+    if entry is None:
+        entry = _shared[key] = [new(obj, *args, **kwargs), 0]
+        entry[0].userData.shared = key
+    entry[1] += 1
+    return entry[0]
+
+def release_shared(instance):
+    """Drop a reference taken by `shared()`, disposing the last one.
+
+    Works with any handle to the instance, e.g. `release_shared(mesh.geometry)`.
+    """
+    key = instance.userData.shared
+    entry = _shared[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _shared[key]
+        instance.dispose()
+
+def shared_stats():
+    """Number of distinct shared instances and references held to them."""
+    return len(_shared), sum(entry[1] for entry in _shared.values())
+
 def get_renderer():
     renderer = new(THREE.WebGLRenderer, antialias=True)
     renderer.setSize(window.innerWidth, window.innerHeight)
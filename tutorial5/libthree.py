@@ -164,21 +164,68 @@ class SceneBase:
     controls: THREE.Controls = field(init=False)
     stats: StatsGL = field(init=False)
     clock: THREE.Clock = field(default_factory=lambda: new(THREE.Clock))
+    # "continuous" redraws on every vsync, "on_demand" only after
+    # `invalidate()`: camera moves, resizes, asset loads, or your own calls.
+    render_mode: str = field(default="continuous")
+    running: bool = field(init=False, repr=False, compare=False)
+    frame_request: int = field(init=False, repr=False, compare=False)
+    frame_proxy: object = field(init=False, repr=False, compare=False)
+    invalidate_proxy: object = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        if self.render_mode not in ("continuous", "on_demand"):
+            raise ValueError(f"Unknown render mode: {self.render_mode}")
+        self.running = False
+        self.frame_request = 0
+        self.frame_proxy = None
+        self.invalidate_proxy = None
         self.scene.add(self.camera)
         self.controls = get_controls(self.camera, self.renderer)
         self.stats = get_stats_gl(self.renderer)
         window.addEventListener("resize", create_proxy(self._on_window_resize))
 
     def start(self):
-        self.renderer.setAnimationLoop(create_proxy(self._animate))
+        if self.running:
+            return
+        self.running = True
+        if self.render_mode == "on_demand":
+            # Made once and reused, so restarting doesn't leak proxies.
+            if self.frame_proxy is None:
+                self.frame_proxy = create_proxy(self._on_demand_frame)
+                self.invalidate_proxy = create_proxy(self.invalidate)
+            self.controls.addEventListener("change", self.invalidate_proxy)
+            self.invalidate()
+        else:
+            self.renderer.setAnimationLoop(create_proxy(self._animate))
         document.getElementById("stats").appendChild(self.stats.dom)
 
     def stop(self):
-        uniforms.call_with_null(self.renderer.setAnimationLoop)
+        if not self.running:
+            return
+        self.running = False
+        if self.render_mode == "on_demand":
+            if self.frame_request:
+                window.cancelAnimationFrame(self.frame_request)
+                self.frame_request = 0
+            self.controls.removeEventListener("change", self.invalidate_proxy)
+        else:
+            uniforms.call_with_null(self.renderer.setAnimationLoop)
         document.getElementById("stats").replaceChildren()
 
+    def invalidate(self, event=None):
+        """Request a redraw of an on-demand scene on the next frame.
+
+        Cheap to call many times per frame, only one redraw gets scheduled.
+        Does nothing in continuous mode or while stopped.
+        """
+        if not self.running or self.frame_proxy is None or self.frame_request:
+            return
+        self.frame_request = window.requestAnimationFrame(self.frame_proxy)
+
+    def _on_demand_frame(self, now=0.0):
+        self.frame_request = 0
+        self._animate(now)
+
     def animate(self, now, delta):
         # your logic goes here in sub-classes
         pass
@@ -206,3 +253,4 @@ class SceneBase:
         else:
             raise ValueError("Unknown camera type")
         renderer.setSize(window.innerWidth, window.innerHeight)
+        self.invalidate()
@@ -125,6 +125,7 @@ class Comparison(SceneBase):
         self.text.castShadow = True
         self.text.position.set(-22, 0, -10)
         self.scene.add(self.text)
+        self.invalidate()
 
 
 @create_proxy
@@ -143,6 +144,9 @@ def on_key_down(event):
 
 document.addEventListener("keydown", on_key_down)
 
+# Nothing here moves unless you move the camera. To only redraw then, use
+# Comparison(render_mode="on_demand") and call `app.invalidate()` after
+# changing the scene from the REPL below.
 app = Comparison()
 app.start()
 
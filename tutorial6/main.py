@@ -34,7 +34,10 @@ class Comparison(SceneBase):
     def __post_init__(self):
         super().__post_init__()
         self.scene.fog = new(THREE.Fog, 0x000000, 10, 100)
-        self.texture_loader = new(THREE.TextureLoader)
+        # redraw once the textures are in
+        loading_manager = new(THREE.LoadingManager)
+        loading_manager.onLoad = create_proxy(self.invalidate)
+        self.texture_loader = new(THREE.TextureLoader, loading_manager)
 
         self.point_light = new(THREE.PointLight, 0xFFFFFF, 1, 0, 0.1)
         self.point_light.name = "PointLight"
@@ -149,6 +152,7 @@ class Comparison(SceneBase):
         self.text.castShadow = True
         self.text.position.set(-22, -3, -10)
         self.scene.add(self.text)
+        self.invalidate()
 
 
 @create_proxy
@@ -167,6 +171,9 @@ def on_key_down(event):
 
 document.addEventListener("keydown", on_key_down)
 
+# Nothing here moves unless you move the camera. To only redraw then, use
+# Comparison(render_mode="on_demand") and call `app.invalidate()` after
+# changing the scene from the REPL below.
 app = Comparison()
 app.start()
 
@@ -153,6 +153,49 @@ def clear():
             e.style.display = "none"
 
 
+@dataclass
+class ShadowPolicy:
+    """Re-renders shadow maps only when something changed.
+
+    Most shadow casters never move, yet three.js redraws every shadow map
+    on every frame. With a policy attached, `shadowMap.autoUpdate` is off
+    and shadows are only redrawn after `mark_dirty()`, after the camera
+    moved (when lights ride along with it, see `camera_lights`), or `rate`
+    times per second for scenes with animated casters.
+    """
+
+    rate: float = field(default=0)  # Hz, 0 means only when dirty
+    camera_lights: bool = field(default=True)
+    dirty: bool = field(init=False)
+    attached: bool = field(init=False, repr=False, compare=False)
+    last_update: float = field(init=False, repr=False, compare=False)
+    updates: int = field(init=False)
+
+    def __post_init__(self):
+        self.dirty = True
+        self.attached = False
+        self.last_update = 0.0
+        self.updates = 0
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def before_render(self, renderer, now, camera_moved):
+        shadow_map = renderer.shadowMap
+        if not self.attached:
+            shadow_map.autoUpdate = False
+            self.attached = True
+        if camera_moved and self.camera_lights:
+            self.dirty = True
+        elif self.rate and now - self.last_update >= 1000 / self.rate:
+            self.dirty = True
+        if self.dirty:
+            shadow_map.needsUpdate = True
+            self.dirty = False
+            self.last_update = now
+            self.updates += 1
+
+
 @dataclass
 class SceneBase:
     scene: THREE.Scene = field(default_factory=lambda: new(THREE.Scene))
@@ -162,6 +205,7 @@ class SceneBase:
     controls: THREE.Controls = field(init=False)
     stats: StatsGL = field(init=False)
     clock: THREE.Clock = field(default_factory=lambda: new(THREE.Clock))
+    shadows: ShadowPolicy | None = field(default=None)
 
     def __post_init__(self):
         self.scene.add(self.camera)
@@ -182,8 +226,10 @@ class SceneBase:
         pass
 
     def _animate(self, now=0.0):
-        self.controls.update()
+        moved = self.controls.update()
         self.animate(now, self.clock.getDelta())
+        if self.shadows is not None:
+            self.shadows.before_render(self.renderer, now, moved)
         self.renderer.render(self.scene, self.camera)
         self.stats.update()
 
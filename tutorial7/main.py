@@ -9,7 +9,7 @@ from pyscript import config
 from pyscript.ffi import create_proxy
 
 from libthree import THREE, new, call, uniforms, clear, dataclass, field
-from libthree import SceneBase, get_ortho_camera
+from libthree import SceneBase, ShadowPolicy, get_ortho_camera
 
 from perlin import perlin3
 
@@ -148,7 +148,13 @@ def on_key_down(event):
 document.addEventListener("keydown", on_key_down)
 
 view_size = 50
-app = Voxels(camera=get_ortho_camera(view_size), view_size=view_size)
+# The terrain never moves: only redraw the shadow map when the camera,
+# and the spot light riding along with it, does.
+app = Voxels(
+    camera=get_ortho_camera(view_size),
+    view_size=view_size,
+    shadows=ShadowPolicy(),
+)
 app.start()
 
 import code
@@ -2,6 +2,9 @@
 
 VERSION = "0073db4bfd46b8651c3378345bdaa00f707fcb08"
 FIELDS_NAME = "__dataclass_fields__"
+FIELDS_TUPLE_NAME = "__dataclass_fields_tuple__"
+INIT_NAMES_NAME = "__dataclass_init_names__"
+FAST_ATTRS_NAME = "__dataclass_fast_attrs__"
 FACTORY_SENTINEL = object()
 class MissingType:
     """Singleton type for MISSING value."""
@@ -25,11 +28,24 @@ def field(
     default = MISSING,
     default_factory = MISSING,
     init: bool = True,
-    repr: bool = True,
+    repr: bool | None = None,
     hash: bool | None = None,
-    compare: bool = True,
+    compare: bool | None = None,
+    lazy: bool = False,
 ) -> "Field":
-    """Function for explicitly declaring a field."""
+    """Function for explicitly declaring a field.
+
+    A `lazy` field isn't initialized in `__init__` unless a value is passed,
+    `default_factory(instance)` builds it on first access instead. Unless
+    asked for, it's left out of `__repr__` and comparisons, which would
+    build it.
+    """
+    if lazy and default_factory is MISSING:
+        raise ValueError("a lazy field needs a default_factory")
+    if repr is None:
+        repr = not lazy
+    if compare is None:
+        compare = not lazy
     return Field(
         default=default,
         default_factory=default_factory,
@@ -37,8 +53,27 @@ def field(
         repr=repr,
         hash=hash,
         compare=compare,
+        lazy=lazy,
     )
 
+class LazyField:
+    """Class attribute building a lazy field's value on first access.
+
+    The value is stored on the instance under the same name, so later
+    lookups don't come back here.
+    """
+
+    def __init__(self, name: str, factory: Any) -> None:
+        self.name = name
+        self.factory = factory
+
+    def __get__(self, obj: Any, cls: type | None = None) -> Any:
+        if obj is None:
+            return self
+        value = self.factory(obj)
+        setattr(obj, self.name, value)
+        return value
+
 class Field:
     """
     Internal representation of a field provided by introspection routines.
@@ -53,8 +88,11 @@ class Field:
     repr: bool
     hash: bool | None
     compare: bool
+    lazy: bool
 
     init_only: bool
+    plain_attr: bool
+    """Stored as a plain instance attribute instead of behind a property."""
 
     def __init__(
         self,
@@ -66,6 +104,7 @@ class Field:
         hash: bool | None = None,
         compare: bool = True,
         init_only: bool = False,
+        lazy: bool = False,
     ) -> None:
         self.name = name
         self.default = default
@@ -75,6 +114,23 @@ class Field:
         self.hash = hash
         self.compare = compare
         self.init_only = init_only
+        self.lazy = lazy
+        self.plain_attr = False
+
+    def copy(self) -> "Field":
+        clone = Field(
+            self.name,
+            default=self.default,
+            default_factory=self.default_factory,
+            init=self.init,
+            repr=self.repr,
+            hash=self.hash,
+            compare=self.compare,
+            init_only=self.init_only,
+            lazy=self.lazy,
+        )
+        clone.plain_attr = self.plain_attr
+        return clone
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Field):
@@ -86,6 +142,9 @@ class Field:
 
     @property
     def _name(self) -> str:
+        """Name of the instance attribute holding the value."""
+        if self.plain_attr:
+            return self.name
         return f"_{self.name}"
 
     @property
@@ -109,6 +168,8 @@ class TransformSpec:
     eq: bool
     order: bool
     frozen: bool
+    fast_attrs: bool
+    replace: bool
     hash: bool | None
     """Tri-state value for adding a __hash__ method.
 
@@ -130,13 +191,16 @@ class TransformSpec:
         order: bool = False,
         unsafe_hash: bool = False,
         frozen: bool = False,
+        fast_attrs: bool = False,
     ) -> None:
         self.init = init and ("__init__" not in cls.__dict__)
-        self.post_init = "__post_init__" in cls.__dict__
+        self.post_init = hasattr(cls, "__post_init__")
         self.repr = repr and ("__repr__" not in cls.__dict__)
         self.eq = eq
         self.order = order
         self.frozen = frozen
+        self.fast_attrs = fast_attrs
+        self.replace = "__replace__" not in cls.__dict__
 
         self.hash = False
         if eq:
@@ -148,8 +212,10 @@ class TransformSpec:
             self.hash = True
 
         fields: dict[str, Field] = {}
-        # Propagate any existing fields from base class.
-        fields.update(getattr(cls, FIELDS_NAME, {}))
+        # Propagate any existing fields from base class. Copies, as they
+        # get changed below and the base class keeps using its own.
+        for name, field in getattr(cls, FIELDS_NAME, {}).items():
+            fields[name] = field.copy()
 
         for name, value in cls.__dict__.items():
             field: Field
@@ -167,6 +233,8 @@ class TransformSpec:
 
             fields[name] = field
         self.fields = sorted(fields.values(), key=lambda f: f.name)
+        for field in self.fields:
+            field.plain_attr = fast_attrs
 
 def _init(fields: list[Field], post_init: bool = False) -> str:
     """Generates the __init__ method."""
@@ -203,6 +271,11 @@ def init_initialize_field(f: Field) -> str:
     Empty string if no initializion is needed.
     """
     left = f"self.{f._name}"
+    if f.lazy:
+        # Left unset, the LazyField on the class takes over.
+        if f.init:
+            return f"if {f.name} is not FACTORY_SENTINEL: {left} = {f.name}"
+        return ""
     if f.init:
         value = f.name
         if f.default_factory is not MISSING:
@@ -215,6 +288,24 @@ def init_initialize_field(f: Field) -> str:
         return f"{left} = {f.default_value_name}()"
     return ""
 
+def _replace(fields: list[Field]) -> str:
+    """Generates the copy constructor used by replace()."""
+    # Fields being replaced aren't read from self, that could be costly
+    # (e.g. a property) or fail.
+    args = (
+        f"{f.name}=changes['{f.name}'] if '{f.name}' in changes else self.{f._name}"
+        for f in fields
+        if f.init
+    )
+    return method(
+        name="__replace__",
+        non_self_args=["**changes"],
+        body=[
+            "check_changes(self, changes)",
+            f"return self.__class__({', '.join(args)})",
+        ],
+    )
+
 def _getter(field: Field) -> str:
     """Generates a field getter."""
     return method(
@@ -301,7 +392,7 @@ def method(
 
 def tuple_str(object_name: str, fields: list[Field]) -> str:
     """An expressing that represents a dataclass instance as a tuple of its fields."""
-    parts = (f"{object_name}._{f.name}," for f in fields)
+    parts = (f"{object_name}.{f._name}," for f in fields)
     return f"({' '.join(parts)})"
 
 def compare(name: str, operator: str, fields: list[Field]) -> str:
@@ -323,20 +414,26 @@ def is_dataclass(obj: object) -> bool:
 def fields(obj: object) -> tuple[Field, ...]:
     """Retrieve all the Fields of an object or class."""
     cls = obj if isinstance(obj, type) else type(obj)
-    return tuple(getattr(cls, FIELDS_NAME).values())
+    return getattr(cls, FIELDS_TUPLE_NAME)
 
 def replace(obj: Any, **changes: Any) -> Any:
     """Create a new object with the specified fields replaced."""
-    fields = getattr(obj, FIELDS_NAME)
-    init_args = {f.name: getattr(obj, f.name) for f in fields.values() if f.init}
-    for name, new_value in changes.items():
-        field = fields.get(name)
-        if not field:
-            raise TypeError(f"Unknown field: {name}")
-        if not field.init:
+    return obj.__replace__(**changes)
+
+def check_changes(obj: Any, changes: dict[str, Any]) -> None:
+    """Raise if `changes` can't be passed to the dataclass's __init__."""
+    init_names = getattr(obj, INIT_NAMES_NAME)
+    for name in changes:
+        if name not in init_names:
+            if name not in getattr(obj, FIELDS_NAME):
+                raise TypeError(f"Unknown field: {name}")
             raise ValueError(f"Cannot replace field defined with init=False: {name}")
-        init_args[name] = new_value
-    return (type(obj))(**init_args)
+
+def store_fields(cls: type, fields: list[Field]) -> None:
+    """Store fields metadata, precomputed for fields() and replace()."""
+    setattr(cls, FIELDS_NAME, {f.name: f for f in fields})
+    setattr(cls, FIELDS_TUPLE_NAME, tuple(fields))
+    setattr(cls, INIT_NAMES_NAME, tuple(f.name for f in fields if f.init))
 
 def dataclass(
     cls: type | None = None, **kwargs: Any
@@ -362,7 +459,16 @@ def _dataclass(
     order: bool = False,
     unsafe_hash: bool = False,
     frozen: bool = False,
+    fast_attrs: bool | None = None,
 ) -> type:
+    # fast_attrs stores fields as plain instance attributes: no property
+    # call on every access, but no frozen instances either. Subclasses
+    # inherit the setting unless they say otherwise.
+    if fast_attrs is None:
+        fast_attrs = getattr(cls, FAST_ATTRS_NAME, False)
+    if fast_attrs and frozen:
+        raise TypeError("a dataclass with fast_attrs=True can't be frozen")
+
     transform = TransformSpec(
         cls,
         init=init,
@@ -371,19 +477,36 @@ def _dataclass(
         order=order,
         unsafe_hash=unsafe_hash,
         frozen=frozen,
+        fast_attrs=fast_attrs,
     )
 
+    if fast_attrs:
+        for field in transform.fields:
+            if field.name in cls.__dict__:
+                # Instance attributes take over, a leftover Field on the
+                # class would be returned for fields that were never set.
+                delattr(cls, field.name)
+            elif isinstance(getattr(cls, field.name, None), property):
+                raise TypeError(
+                    f"field {field.name!r} is a property on a base class,"
+                    " fast_attrs=True needs fast_attrs bases"
+                )
+
     for name, value in make_methods(transform).items():
         setattr(cls, name, value)
+    for field in transform.fields:
+        if field.lazy:
+            setattr(cls, field._name, LazyField(field._name, field.default_factory))
+    setattr(cls, FAST_ATTRS_NAME, fast_attrs)
 
-    # Store fields metadata
-    setattr(cls, FIELDS_NAME, {f.name: f for f in transform.fields})
+    store_fields(cls, transform.fields)
     return cls
 
 def make_global_bindings(transform: TransformSpec) -> dict[str, Any]:
     bindings: dict[str, Any] = {
         "FrozenInstanceError": FrozenInstanceError,
         "FACTORY_SENTINEL": FACTORY_SENTINEL,
+        "check_changes": check_changes,
     }
     for field in transform.fields:
         if field.default is not MISSING:
@@ -392,33 +515,116 @@ def make_global_bindings(transform: TransformSpec) -> dict[str, Any]:
             bindings[field.default_value_name] = field.default_factory
     return bindings
 
-def make_methods(transform: TransformSpec) -> dict[str, Any]:
-    global_bindings = make_global_bindings(transform)
-    methods: dict[str, Any] = {}
+def make_source(transform: TransformSpec) -> str:
+    """Generates the source code of all methods of a dataclass."""
+    code: list[str] = []
 
-    def add_method(code: str) -> None:
-        exec(code, global_bindings, methods)
-
-    for field in transform.fields:
-        add_method(_getter(field))
-        add_method(_setter(field, transform.frozen))
-        add_method(_deleter(field, transform.frozen))
+    if not transform.fast_attrs:
+        for field in transform.fields:
+            code.append(_getter(field))
+            code.append(_setter(field, transform.frozen))
+            code.append(_deleter(field, transform.frozen))
 
     if transform.init:
-        add_method(_init(transform.fields, post_init=transform.post_init))
+        code.append(_init(transform.fields, post_init=transform.post_init))
     if transform.repr:
-        add_method(_repr(transform.fields))
+        code.append(_repr(transform.fields))
+    if transform.replace:
+        code.append(_replace(transform.fields))
     if transform.eq:
-        add_method(_eq(transform.fields))
+        code.append(_eq(transform.fields))
     if transform.order:
-        add_method(_lt(transform.fields))
-        add_method(_le(transform.fields))
-        add_method(_gt(transform.fields))
-        add_method(_ge(transform.fields))
+        code.append(_lt(transform.fields))
+        code.append(_le(transform.fields))
+        code.append(_gt(transform.fields))
+        code.append(_ge(transform.fields))
+    if transform.hash:
+        code.append(_hash(transform.fields))
+
+    return "\n".join(code)
+
+try:
+    compile
+except NameError:
+    # MicroPython built without compile(), exec() takes the source instead.
+    def compile(source: str, filename: str, mode: str) -> Any:
+        return source
+
+CODE_CACHE_SIZE = 32
+_code_cache: dict[tuple, Any] = {}
+_code_cache_order: list[tuple] = []
+_code_cache_stats = [0, 0]  # hits, misses
+
+def code_cache_key(transform: TransformSpec) -> tuple:
+    """Everything make_source() output depends on.
+
+    Default values themselves aren't part of it, the generated code only
+    refers to them by name through the global bindings.
+    """
+    return (
+        tuple(
+            (
+                f.name,
+                f.init,
+                f.repr,
+                f.compare,
+                f.contributes_to_hash,
+                f.default is not MISSING,
+                f.default_factory is not MISSING,
+                f.lazy,
+            )
+            for f in transform.fields
+        ),
+        transform.init,
+        transform.post_init,
+        transform.repr,
+        transform.eq,
+        transform.order,
+        transform.frozen,
+        transform.hash,
+        transform.fast_attrs,
+        transform.replace,
+    )
+
+def compiled_methods(transform: TransformSpec) -> Any:
+    """Compiled code of all methods, shared by classes with the same layout."""
+    key = code_cache_key(transform)
+    code = _code_cache.get(key)
+    if code is not None:
+        _code_cache_stats[0] += 1
+        return code
+    _code_cache_stats[1] += 1
+    code = compile(make_source(transform), "<dataclass>", "exec")
+    if len(_code_cache_order) >= CODE_CACHE_SIZE:
+        del _code_cache[_code_cache_order.pop(0)]
+    _code_cache[key] = code
+    _code_cache_order.append(key)
+    return code
+
+def code_cache_info() -> dict[str, int]:
+    """Hits, misses and size of the compiled code cache."""
+    return {
+        "hits": _code_cache_stats[0],
+        "misses": _code_cache_stats[1],
+        "size": len(_code_cache),
+        "maxsize": CODE_CACHE_SIZE,
+    }
+
+def clear_code_cache() -> None:
+    _code_cache.clear()
+    _code_cache_order.clear()
+    _code_cache_stats[0] = _code_cache_stats[1] = 0
+
+def make_methods(transform: TransformSpec) -> dict[str, Any]:
+    global_bindings = make_global_bindings(transform)
+    methods: dict[str, Any] = {}
+
+    # A single exec per class: every compiler invocation has a fixed cost
+    # that dominates for methods this small, especially on MicroPython.
+    # Classes with the same field layout skip the compiler altogether.
+    exec(compiled_methods(transform), global_bindings, methods)
 
     if transform.hash is None:
         methods["__hash__"] = None
-    if transform.hash:
-        add_method(_hash(transform.fields))
 
     return methods
@@ -0,0 +1,47 @@
+/* Per-frame property writes applied in one call from Python.
+ *
+ * Every record in `data` is five numbers: target id, op, and three values.
+ * Use in Python through libthree.CommandBuffer:
+ *   sphere_id = app.commands.register(sphere)
+ *   app.commands.position(sphere_id, x, y, z)
+ */
+const POSITION = 0;
+const ROTATION = 1;
+const SCALE = 2;
+const COLOR = 3;
+const VISIBLE = 4;
+const STRIDE = 5;
+
+const targets = [];
+const free = [];
+
+function register(obj) {
+    if (free.length) {
+        const id = free.pop();
+        targets[id] = obj;
+        return id;
+    }
+    targets.push(obj);
+    return targets.length - 1;
+}
+
+function release(id) {
+    targets[id] = null;
+    free.push(id);
+}
+
+function apply(data, length) {
+    for (let i = 0; i < length; i += STRIDE) {
+        const target = targets[data[i]];
+        const x = data[i + 2], y = data[i + 3], z = data[i + 4];
+        switch (data[i + 1]) {
+            case POSITION: target.position.set(x, y, z); break;
+            case ROTATION: target.rotation.set(x, y, z); break;
+            case SCALE: target.scale.set(x, y, z); break;
+            case COLOR: target.color.setRGB(x, y, z); break;
+            case VISIBLE: target.visible = x !== 0; break;
+        }
+    }
+}
+
+export { register, release, apply }
@@ -0,0 +1,23 @@
+/* Render loop that stays in JS and only calls into Python when asked to.
+ *
+ * `callback(now)` runs at most once every `interval` ms; pass null to
+ * never call it. Change what's drawn through the returned driver:
+ *   driver = loop.start(renderer, scene, camera, controls, stats, cb, 0)
+ *   driver.scene = other_scene
+ */
+function start(renderer, scene, camera, controls, stats, callback, interval) {
+    const driver = { scene: scene, camera: camera, callback: callback };
+    let lastCall = -Infinity;
+    renderer.setAnimationLoop((now) => {
+        controls.update();
+        if (driver.callback && now - lastCall >= interval) {
+            lastCall = now;
+            driver.callback(now);
+        }
+        renderer.render(driver.scene, driver.camera);
+        stats.update();
+    });
+    return driver;
+}
+
+export { start }
@@ -0,0 +1,94 @@
+/* Frees the GPU resources held by a scene graph in a single call.
+ *
+ * Use in Python like:
+ *   resources.dispose_tree(scene)
+ *   resources.dispose_unused(scene, to_js([other_scene, ...]))
+ */
+function disposeMaterial(material, seen) {
+    if (seen.has(material)) {
+        return 0;
+    }
+    seen.add(material);
+    let count = 1;
+    for (const value of Object.values(material)) {
+        if (value && value.isTexture && !seen.has(value)) {
+            seen.add(value);
+            value.dispose();
+            count++;
+        }
+    }
+    material.dispose();
+    return count;
+}
+
+function dispose_tree(root, seen = new Set()) {
+    let count = 0;
+    root.traverse((obj) => {
+        if (obj.geometry && !seen.has(obj.geometry)) {
+            seen.add(obj.geometry);
+            obj.geometry.dispose();
+            count++;
+        }
+        if (Array.isArray(obj.material)) {
+            for (const material of obj.material) {
+                count += disposeMaterial(material, seen);
+            }
+        } else if (obj.material) {
+            count += disposeMaterial(obj.material, seen);
+        }
+        if (obj.isLight && obj.shadow && obj.shadow.map) {
+            obj.shadow.map.dispose();
+            count++;
+        }
+    });
+    if (root.background && root.background.isTexture) {
+        root.background.dispose();
+        count++;
+    }
+    return count;
+}
+
+function isShared(resource) {
+    return Boolean(resource.userData && resource.userData.shared);
+}
+
+// Adds the geometries, materials and textures under `root` to `found`.
+// With `onlyShared`, just the ones made by shared() and their textures.
+function collect(root, found, onlyShared) {
+    root.traverse((obj) => {
+        if (obj.geometry && (!onlyShared || isShared(obj.geometry))) {
+            found.add(obj.geometry);
+        }
+        const materials = Array.isArray(obj.material) ? obj.material : [obj.material];
+        for (const material of materials) {
+            if (!material) {
+                continue;
+            }
+            const keepAll = !onlyShared || isShared(material);
+            if (keepAll) {
+                found.add(material);
+            }
+            for (const value of Object.values(material)) {
+                if (value && value.isTexture && (keepAll || isShared(value))) {
+                    found.add(value);
+                }
+            }
+        }
+    });
+    if (!onlyShared && root.background && root.background.isTexture) {
+        found.add(root.background);
+    }
+}
+
+// Like dispose_tree() but leaves alone whatever is also used under one of
+// the `keep` roots, and instances owned by shared()'s reference counts.
+function dispose_unused(root, keep) {
+    const seen = new Set();
+    for (const other of keep) {
+        collect(other, seen, false);
+    }
+    collect(root, seen, true);
+    return dispose_tree(root, seen);
+}
+
+export { dispose_tree, dispose_unused }
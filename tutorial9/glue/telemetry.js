@@ -0,0 +1,21 @@
+/* Gathers one frame's worth of numbers in a single call from Python.
+ *
+ * Call after stats.update(): it logs this frame's CPU and GPU times into
+ * stats.averageCpu/averageGpu, then zeroes totalCpuDuration.
+ *   telemetry.sample(stats, renderer)
+ */
+function last(logs) {
+    return logs.length ? logs[logs.length - 1] : 0;
+}
+
+function sample(stats, renderer) {
+    const render = renderer.info.render;
+    return [
+        last(stats.averageCpu.logs),
+        last(stats.averageGpu.logs),
+        render.calls,
+        render.triangles,
+    ];
+}
+
+export { sample }
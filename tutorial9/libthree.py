@@ -1,7 +1,51 @@
 import asyncio
+import json
+import math
 
 try:
-    from dataclasses import dataclass, field
+    import dataclasses
+
+    class LazyField:
+        # Same as udataclasses.LazyField, but stdlib dataclasses assign the
+        # default in `__init__`, so this is a data descriptor ignoring that.
+
+        def __init__(self, factory):
+            self.factory = factory
+            self.name = None
+
+        def __set_name__(self, owner, name):
+            self.name = name
+
+        def __get__(self, obj, cls=None):
+            if obj is None:
+                return self
+            try:
+                return obj.__dict__[self.name]
+            except KeyError:
+                value = obj.__dict__[self.name] = self.factory(obj)
+                return value
+
+        def __set__(self, obj, value):
+            if value is not self:
+                obj.__dict__[self.name] = value
+
+    def field(*, lazy=False, **kwargs):
+        # A `lazy` field is built by `default_factory(instance)` on first
+        # access, unless a value was passed to `__init__`. Unless asked for,
+        # it's left out of `__repr__` and comparisons, which would build it.
+        if lazy:
+            if "default_factory" not in kwargs:
+                raise ValueError("a lazy field needs a default_factory")
+            kwargs.setdefault("repr", False)
+            kwargs.setdefault("compare", False)
+            kwargs["default"] = LazyField(kwargs.pop("default_factory"))
+        return dataclasses.field(**kwargs)
+
+    def dataclass(cls=None, *, fast_attrs=False, **kwargs):
+        # Fields of stdlib dataclasses are plain attributes already, so
+        # `fast_attrs` is only meaningful to udataclasses.
+        return dataclasses.dataclass(cls, **kwargs)
+
 except ImportError:
     from udataclasses import dataclass, field
 
@@ -17,6 +61,10 @@ from pyscript.js_modules.gltf import GLTFLoader
 # JS: import Stats from 'stats';
 from pyscript.js_modules.stats_gl import default as StatsGL
 from pyscript.js_modules import uniforms
+from pyscript.js_modules import batch
+from pyscript.js_modules import resources
+from pyscript.js_modules import telemetry
+from pyscript.js_modules import loop
 
 from pyscript.ffi import to_js, create_proxy
 
@@ -30,6 +78,20 @@ if MICROPYTHON:
     def call(obj, *args, **kwargs):
         return obj(*args, kwargs) if kwargs else obj(*args)
 
+    import time
+
+    def perf_counter():
+        return time.ticks_us()
+
+    def elapsed_ms(start, end):
+        return time.ticks_diff(end, start) / 1000
+
+    def command_array():
+        return []
+
+    def js_list(arr):
+        return list(arr)
+
 else:
 
     def new(obj, *args, **kwargs):
@@ -38,8 +100,139 @@ else:
     def call(obj, *args, **kwargs):
         return obj(*args, **kwargs)
 
+    def perf_counter():
+        return window.performance.now()
+
+    def elapsed_ms(start, end):
+        return end - start
+
+    from array import array
+
+    def command_array():
+        # converted by to_js() into a Float64Array with a single copy
+        return array("d")
+
+    def js_list(arr):
+        return arr.to_py()
+
+
+# shared instances by repr((constructor name, args, kwargs)): [instance, refcount]
+# The key is also kept in the instance's userData.shared for release_shared().
+_shared = {}
+
+
+def shared(obj, *args, **kwargs):
+    """Like `new()` but returns one shared instance per distinct arguments.
+
+    Meant for geometries and materials that many meshes can reuse. Arguments
+    must be hashable. Objects you're going to mutate (e.g. a material whose
+    color changes per mesh) must not be shared, create those with `new()`.
+    Every call takes a reference, give it back with `release_shared()`.
+    """
+    key = repr((obj.name, args, tuple(sorted(kwargs.items()))))
+    entry = _shared.get(key)
+    if entry is None:
+        entry = _shared[key] = [new(obj, *args, **kwargs), 0]
+        entry[0].userData.shared = key
+    entry[1] += 1
+    return entry[0]
+
+
+def release_shared(instance):
+    """Drop a reference taken by `shared()`, disposing the last one.
+
+    Works with any handle to the instance, e.g. `release_shared(mesh.geometry)`.
+    """
+    key = instance.userData.shared
+    entry = _shared[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _shared[key]
+        instance.dispose()
+
+
+def shared_stats():
+    """Number of distinct shared instances and references held to them."""
+    return len(_shared), sum(entry[1] for entry in _shared.values())
+
+
+def bind(obj, path):
+    """Resolve the dotted attribute `path` on `obj` once and return it.
+
+    Every `obj.rotation` lookup crosses into JS and makes a new proxy, so
+    bind hot targets up front and only write to the handle in `animate()`:
+
+        self.logo_rotation = bind(self.python_logo, "rotation")
+        ...
+        self.logo_rotation.x = now / 1000
+    """
+    for name in path.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def bind_setter(obj, path):
+    """Like `bind()` but returns a function setting the last attribute in `path`."""
+    names = path.split(".")
+    target = bind(obj, ".".join(names[:-1])) if len(names) > 1 else obj
+    name = names[-1]
+
+    def setter(value):
+        setattr(target, name, value)
+
+    return setter
+
+
+class ProxyRegistry:
+    """Owns JS proxies so they can be destroyed together.
+
+    Pyodide never frees a proxy made with `create_proxy` on its own, so
+    every scene rebuilt from the REPL leaked its callbacks. Create proxies
+    through `registry.create(func)` instead and call `destroy_all()` when
+    the owner goes away.
+    """
+
+    def __init__(self):
+        self.live = {}
+
+    def __len__(self):
+        return len(self.live)
+
+    def __repr__(self):
+        return f"<ProxyRegistry: {len(self.live)} live proxies>"
+
+    def create(self, func):
+        proxy = create_proxy(func)
+        self.live[id(proxy)] = (getattr(func, "__name__", "?"), proxy)
+        return proxy
 
-def get_renderer():
+    def destroy(self, proxy):
+        if proxy is None:
+            return
+        if self.live.pop(id(proxy), None) is None:
+            return
+        destroy = getattr(proxy, "destroy", None)
+        if destroy is not None:
+            destroy()
+
+    def destroy_all(self):
+        for name, proxy in list(self.live.values()):
+            self.destroy(proxy)
+
+    def counts(self):
+        """Live proxies by function name."""
+        result = {}
+        for name, proxy in self.live.values():
+            result[name] = result.get(name, 0) + 1
+        return result
+
+
+# Proxies that live as long as the page. The helpers below use it unless
+# they're given the `proxies` of the scene they're building for.
+shared_proxies = ProxyRegistry()
+
+
+def get_renderer(proxies=shared_proxies):
     renderer = new(THREE.WebGLRenderer, antialias=True)
     renderer.setSize(window.innerWidth, window.innerHeight)
     renderer.setPixelRatio(window.devicePixelRatio)
@@ -54,7 +247,7 @@ def get_renderer():
     document.getElementById("threejs").appendChild(renderer.domElement)
     initial = {0: "115px", 1: "calc(100vh - 120px)"}
 
-    @create_proxy
+    @proxies.create
     def split_element_style(dimension, size, gutter_size, index):
         if index in initial:
             result = {dimension: initial.pop(index)}
@@ -62,7 +255,9 @@ def get_renderer():
             result = {dimension: f"calc({int(size)}vh - {gutter_size}px)"}
         return to_js(result)
 
-    call(
+    # Kept on the renderer so SceneBase.dispose() can destroy it before
+    # the proxy it calls back into.
+    renderer.split = call(
         window.Split,
         ["#pyterm", "#threejs"],
         direction="vertical",
@@ -118,29 +313,35 @@ def get_stats_gl(renderer):
     return stats
 
 
-def get_loading_manager():
+def get_loading_manager(on_change=None, proxies=shared_proxies):
+    # `on_change` gets called every time an asset finishes loading,
+    # pass `SceneBase.invalidate` to redraw on-demand scenes.
     loading_mgr = new(THREE.LoadingManager)
     ev = asyncio.Event()
     
-    @create_proxy
+    @proxies.create
     def on_start(url, itemsLoaded, itemsTotal):
         print(f'[{itemsLoaded}/{itemsTotal}] Started loading file: {url}')
     loading_mgr.onStart = on_start
     
-    @create_proxy
+    @proxies.create
     def on_progress(url, itemsLoaded, itemsTotal):
         print(f'[{itemsLoaded}/{itemsTotal}] Loading file: {url}')
+        if on_change is not None:
+            on_change()
     loading_mgr.onProgress = on_progress
     
-    @create_proxy
+    @proxies.create
     def on_error(url):
         print(f'There was a problem loading {url}')
     loading_mgr.onError = on_error
     
-    @create_proxy
+    @proxies.create
     def on_load():
         print('Loading assets complete!')
         ev.set()
+        if on_change is not None:
+            on_change()
     loading_mgr.onLoad = on_load
     
     return loading_mgr, ev
@@ -184,39 +385,672 @@ def clear():
             e.style.display = "none"
 
 
-@dataclass
+def dispose_object(obj):
+    """Remove `obj` from its parent and free its geometries, materials and textures.
+
+    Only use on objects that don't share those with anything still in a scene.
+    """
+    obj.removeFromParent()
+    return resources.dispose_tree(obj)
+
+
+@dataclass(fast_attrs=True)
+class MemoryWatchdog:
+    """Periodically samples `renderer.info` and warns about GPU leaks.
+
+    A warning is printed when the geometry, texture or shader program count
+    grew on `warn_after` samples in a row. Samples are kept in `history`.
+    """
+
+    interval: float = field(default=5.0)  # seconds
+    warn_after: int = field(default=6)
+    history: list = field(default_factory=list)
+    task: object = field(init=False, repr=False, compare=False)
+    growing: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.task = None
+        self.growing = {}
+
+    def sample(self, renderer):
+        info = renderer.info
+        programs = info.programs
+        current = {
+            "geometries": info.memory.geometries,
+            "textures": info.memory.textures,
+            "programs": programs.length if programs else 0,
+        }
+        previous = self.history[-1] if self.history else current
+        self.history.append(current)
+        del self.history[: -self.warn_after * 10]
+        for kind, count in current.items():
+            if count > previous[kind]:
+                self.growing[kind] = self.growing.get(kind, 0) + 1
+            else:
+                self.growing[kind] = 0
+            if self.growing[kind] == self.warn_after:
+                print(
+                    f"Possible GPU leak: {kind} grew on {self.warn_after}"
+                    f" samples in a row, now at {count}"
+                )
+        return current
+
+    async def run(self, renderer):
+        while True:
+            self.sample(renderer)
+            await asyncio.sleep(self.interval)
+
+    def start(self, renderer):
+        if self.task is None:
+            self.task = asyncio.create_task(self.run(renderer))
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+
+@dataclass(fast_attrs=True)
+class FrameProfiler:
+    """Per-phase frame timings kept in a fixed-size ring buffer.
+
+    Attach to a scene with `app.profiler = FrameProfiler()` and read
+    `app.profiler.summary()` from the REPL. All durations are in ms.
+    """
+
+    capacity: int = field(default=600)
+    phases: tuple = field(default=("controls", "animate", "render", "stats"))
+    samples: dict = field(init=False, repr=False, compare=False)
+    count: int = field(init=False, repr=False, compare=False)
+    index: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.samples = {phase: [0.0] * self.capacity for phase in self.phases}
+        self.count = 0
+        self.index = 0
+
+    def add_frame(self, *durations):
+        index = self.index
+        for phase, duration in zip(self.phases, durations):
+            self.samples[phase][index] = duration
+        self.index = (index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def reset(self):
+        self.__post_init__()
+
+    def history(self, phase):
+        """Samples for `phase`, oldest first."""
+        buf = self.samples[phase]
+        if self.count < self.capacity:
+            return buf[: self.count]
+        return buf[self.index :] + buf[: self.index]
+
+    def percentile(self, phase, pct):
+        values = sorted(self.history(phase))
+        if not values:
+            return 0.0
+        # nearest-rank
+        rank = max(0, min(len(values) - 1, math.ceil(pct * len(values) / 100) - 1))
+        return values[rank]
+
+    def summary(self):
+        result = {}
+        for phase in self.phases:
+            result[phase] = {
+                "p50": self.percentile(phase, 50),
+                "p95": self.percentile(phase, 95),
+                "p99": self.percentile(phase, 99),
+            }
+        return result
+
+    def report(self):
+        print(f"{'phase':>10} {'p50':>8} {'p95':>8} {'p99':>8}  ({self.count} frames)")
+        for phase, p in self.summary().items():
+            print(f"{phase:>10} {p['p50']:8.3f} {p['p95']:8.3f} {p['p99']:8.3f}")
+
+    def to_json(self):
+        """JSON trace: per-phase samples (oldest first) and percentiles."""
+        return json.dumps(
+            {
+                "frames": self.count,
+                "phases": {phase: self.history(phase) for phase in self.phases},
+                "summary": self.summary(),
+            }
+        )
+
+
+@dataclass(fast_attrs=True)
+class Telemetry(FrameProfiler):
+    """Rolling window of per-frame numbers from StatsGL and `renderer.info`.
+
+    Records CPU and GPU time in ms (GPU time needs StatsGL's `trackGPU`,
+    and lags a few frames behind), and draw calls and triangles per frame.
+    Summaries can be sent somewhere with `post()` or saved with `download()`.
+    """
+
+    phases: tuple = field(default=("cpu", "gpu", "calls", "triangles"))
+    label: str = field(default="")
+
+    def sample(self, stats, renderer):
+        self.add_frame(*js_list(telemetry.sample(stats, renderer)))
+
+    def summary_json(self):
+        return json.dumps(
+            {
+                "label": self.label,
+                "frames": self.count,
+                "user_agent": window.navigator.userAgent,
+                "device_pixel_ratio": window.devicePixelRatio,
+                "summary": self.summary(),
+            }
+        )
+
+    async def post(self, url):
+        response = await window.fetch(
+            url,
+            to_js(
+                {
+                    "method": "POST",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": self.summary_json(),
+                }
+            ),
+        )
+        return response.status
+
+    def download(self, filename="telemetry.json"):
+        blob = new(
+            window.Blob,
+            to_js([self.summary_json()]),
+            to_js({"type": "application/json"}),
+        )
+        url = window.URL.createObjectURL(blob)
+        link = document.createElement("a")
+        link.href = url
+        link.download = filename
+        link.click()
+        window.URL.revokeObjectURL(url)
+
+
+@dataclass(fast_attrs=True)
+class PixelRatioController:
+    """Steps the renderer's pixel ratio to hold `target_fps`.
+
+    Frame time is a moving average of the intervals between animation
+    frames. The ratio drops by `step` as soon as the average is over budget
+    by more than `tolerance`. Since vsync caps the frame rate, we can't wait
+    to be "under budget" to go back up; instead the ratio climbs towards
+    the device ratio after `upgrade_after` consecutive frames within half
+    the tolerance. After each change the controller waits `cooldown` frames
+    so the new ratio gets measured before the next step.
+
+    An upgrade that has to be taken back within `upgrade_after` frames
+    failed: retrying that ratio then waits twice as long as the previous
+    attempt, up to `max_upgrade_after` frames. Once an upgrade to it holds,
+    the wait goes back to `upgrade_after`.
+    """
+
+    target_fps: float = field(default=60)
+    min_ratio: float = field(default=0.5)
+    max_ratio: float | None = field(default=None)  # None: window.devicePixelRatio
+    step: float = field(default=0.25)
+    tolerance: float = field(default=0.15)
+    smoothing: float = field(default=0.1)
+    cooldown: int = field(default=30)
+    upgrade_after: int = field(default=180)
+    max_upgrade_after: int = field(default=5760)
+    ratio: float = field(init=False)
+    average_ms: float = field(init=False)
+    last_now: float = field(init=False)
+    frames_left: int = field(init=False)
+    good_frames: int = field(init=False)
+    failed_ratio: float = field(init=False)
+    upgrade_wait: int = field(init=False)
+    probation: int = field(init=False)
+
+    def __post_init__(self):
+        self.ratio = 0.0
+        self.average_ms = 1000 / self.target_fps
+        self.last_now = -1.0
+        self.frames_left = self.cooldown
+        self.good_frames = 0
+        self.failed_ratio = 0.0
+        self.upgrade_wait = self.upgrade_after
+        self.probation = 0
+
+    def device_ratio(self):
+        if self.max_ratio is not None:
+            return self.max_ratio
+        return window.devicePixelRatio
+
+    def update(self, renderer, now):
+        if not self.ratio:
+            self.ratio = renderer.getPixelRatio()
+        last_now = self.last_now
+        self.last_now = now
+        if last_now < 0:
+            return
+        frame_ms = now - last_now
+        if frame_ms <= 0 or frame_ms > 250:
+            # Tab was hidden or the loop was paused, don't learn from it.
+            return
+        self.average_ms += (frame_ms - self.average_ms) * self.smoothing
+        if self.frames_left > 0:
+            self.frames_left -= 1
+            return
+
+        budget_ms = 1000 / self.target_fps
+        ratio = self.ratio
+        if self.average_ms > budget_ms * (1 + self.tolerance):
+            self.good_frames = 0
+            ratio = max(self.min_ratio, ratio - self.step)
+            if self.probation and ratio != self.ratio:
+                # The last upgrade didn't hold, back off before retrying it.
+                self.probation = 0
+                self.failed_ratio = self.ratio
+                self.upgrade_wait = min(
+                    self.upgrade_wait * 2, self.max_upgrade_after
+                )
+            return self._set_ratio(renderer, ratio)
+
+        if self.probation:
+            self.probation -= 1
+            if not self.probation and self.ratio >= self.failed_ratio:
+                self.failed_ratio = 0.0
+                self.upgrade_wait = self.upgrade_after
+        if self.average_ms < budget_ms * (1 + self.tolerance / 2):
+            self.good_frames += 1
+            target = min(self.device_ratio(), ratio + self.step)
+            if target >= self.failed_ratio:
+                wait = self.upgrade_wait
+            else:
+                wait = self.upgrade_after
+            if self.good_frames >= wait and target != ratio:
+                self.good_frames = 0
+                self.probation = self.upgrade_after
+                ratio = target
+        else:
+            self.good_frames = 0
+        self._set_ratio(renderer, ratio)
+
+    def _set_ratio(self, renderer, ratio):
+        if ratio != self.ratio:
+            self.ratio = ratio
+            self.frames_left = self.cooldown
+            renderer.setPixelRatio(ratio)
+
+
+@dataclass(fast_attrs=True)
+class ShadowPolicy:
+    """Re-renders shadow maps only when something changed.
+
+    Most shadow casters never move, yet three.js redraws every shadow map
+    on every frame. With a policy attached, `shadowMap.autoUpdate` is off
+    and shadows are only redrawn after `mark_dirty()`, after the camera
+    moved (when lights ride along with it, see `camera_lights`), or `rate`
+    times per second for scenes with animated casters.
+    """
+
+    rate: float = field(default=0)  # Hz, 0 means only when dirty
+    camera_lights: bool = field(default=True)
+    dirty: bool = field(init=False)
+    attached: bool = field(init=False, repr=False, compare=False)
+    last_update: float = field(init=False, repr=False, compare=False)
+    updates: int = field(init=False)
+
+    def __post_init__(self):
+        self.dirty = True
+        self.attached = False
+        self.last_update = 0.0
+        self.updates = 0
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def before_render(self, renderer, now, camera_moved):
+        shadow_map = renderer.shadowMap
+        if not self.attached:
+            shadow_map.autoUpdate = False
+            self.attached = True
+        if camera_moved and self.camera_lights:
+            self.dirty = True
+        elif self.rate and now - self.last_update >= 1000 / self.rate:
+            self.dirty = True
+        if self.dirty:
+            shadow_map.needsUpdate = True
+            self.dirty = False
+            self.last_update = now
+            self.updates += 1
+
+
+@dataclass(fast_attrs=True)
+class CommandBuffer:
+    """Batches per-frame property writes into one crossing to JS.
+
+    Register each target once, then record writes during `animate()`.
+    SceneBase flushes the whole batch after `animate()` returns:
+
+        self.sphere_id = self.commands.register(sphere)
+        ...
+        self.commands.position(self.sphere_id, x, y, z)
+
+    `color()` targets a material, all other writes target an Object3D.
+    """
+
+    data: object = field(default_factory=command_array, repr=False)
+
+    def register(self, obj):
+        return batch.register(obj)
+
+    def release(self, target):
+        batch.release(target)
+
+    def position(self, target, x, y, z):
+        self.data.extend((target, 0, x, y, z))
+
+    def rotation(self, target, x, y, z):
+        self.data.extend((target, 1, x, y, z))
+
+    def scale(self, target, x, y, z):
+        self.data.extend((target, 2, x, y, z))
+
+    def color(self, target, r, g, b):
+        self.data.extend((target, 3, r, g, b))
+
+    def visible(self, target, value):
+        self.data.extend((target, 4, 1 if value else 0, 0, 0))
+
+    def flush(self):
+        data = self.data
+        if data:
+            batch.apply(to_js(data), len(data))
+            self.data = command_array()
+
+
+@dataclass(fast_attrs=True)
 class SceneBase:
-    scene: THREE.Scene = field(default_factory=lambda: new(THREE.Scene))
-    renderer: THREE.WebGLRenderer = field(default_factory=get_renderer)
-    camera: THREE.Camera = field(default_factory=get_perspective_camera)
+    # Lazy fields are built on first access. Unless `__post_init__` uses
+    # them, the WebGL context, controls and stats are only created by
+    # `start()` or `warmup()`.
+    scene: THREE.Scene = field(default_factory=lambda app: new(THREE.Scene), lazy=True)
+    renderer: THREE.WebGLRenderer = field(
+        default_factory=lambda app: get_renderer(app.proxies), lazy=True
+    )
+    camera: THREE.Camera = field(
+        default_factory=lambda app: get_perspective_camera(), lazy=True
+    )
     view_size: int = field(default=50)
-    controls: THREE.Controls = field(init=False)
-    stats: StatsGL = field(init=False)
-    clock: THREE.Clock = field(default_factory=lambda: new(THREE.Clock))
+    controls: THREE.Controls = field(
+        default_factory=lambda app: get_controls(app.camera, app.renderer),
+        init=False,
+        lazy=True,
+    )
+    stats: StatsGL = field(
+        default_factory=lambda app: get_stats_gl(app.renderer), init=False, lazy=True
+    )
+    clock: THREE.Clock = field(default_factory=lambda app: new(THREE.Clock), lazy=True)
+    commands: CommandBuffer = field(default_factory=CommandBuffer, repr=False)
+    profiler: FrameProfiler | None = field(default=None)
+    telemetry: Telemetry | None = field(default=None)
+    proxies: ProxyRegistry = field(default_factory=ProxyRegistry, repr=False)
+    resolution: PixelRatioController | None = field(default=None)
+    watchdog: MemoryWatchdog | None = field(default=None)
+    shadows: ShadowPolicy | None = field(default=None)
+    # "continuous" redraws on every vsync, "on_demand" only after
+    # `invalidate()`: camera moves, resizes, asset loads, or your own calls.
+    # "hybrid" redraws on every vsync from a JS loop, calling into Python
+    # only if `animate()`/`update()` are in use, at most `animate_rate`
+    # times per second. The profiler, telemetry, resolution and shadow
+    # policies need Python on every frame so they don't run in it.
+    render_mode: str = field(default="continuous")
+    animate_rate: float | None = field(default=None)
+    driver: object = field(init=False, repr=False, compare=False)
+    attached: bool = field(init=False, repr=False, compare=False)
+    running: bool = field(init=False, repr=False, compare=False)
+    frame_request: int = field(init=False, repr=False, compare=False)
+    frame_proxy: object = field(init=False, repr=False, compare=False)
+    invalidate_proxy: object = field(init=False, repr=False, compare=False)
+    resize_proxy: object = field(init=False, repr=False, compare=False)
+    # Set `tick_rate` (Hz) to get `update(dt)` called at a fixed rate,
+    # independent of the display refresh rate. At most `max_steps` updates
+    # run per frame, the rest of a backlog after a slow frame is dropped.
+    tick_rate: float | None = field(default=None)
+    max_steps: int = field(default=5)
+    accumulator: float = field(init=False, repr=False, compare=False)
+    alpha: float = field(init=False, repr=False, compare=False)
+    warmup_ms: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        if self.render_mode not in ("continuous", "on_demand", "hybrid"):
+            raise ValueError(f"Unknown render mode: {self.render_mode}")
+        self.attached = False
+        self.running = False
+        self.frame_request = 0
+        self.frame_proxy = None
+        self.driver = None
+        self.invalidate_proxy = None
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.warmup_ms = 0.0
+        self.resize_proxy = None
+        # No WebGL context needed for this, and lights attached to the
+        # camera have to be in the scene when shaders get compiled.
         self.scene.add(self.camera)
-        self.controls = get_controls(self.camera, self.renderer)
-        self.stats = get_stats_gl(self.renderer)
-        window.addEventListener("resize", create_proxy(self._on_window_resize))
+
+    def attach(self):
+        """Get ready to render: track window resizes.
+
+        Only does something the first time. The renderer, and with it the
+        WebGL context, gets built on its first use right after.
+        """
+        if self.attached:
+            return
+        self.attached = True
+        self.resize_proxy = self.proxies.create(self._on_window_resize)
+        window.addEventListener("resize", self.resize_proxy)
 
     def start(self):
-        self.renderer.setAnimationLoop(create_proxy(self._animate))
+        if self.running:
+            return
+        self.attach()
+        self.running = True
+        if self.render_mode == "on_demand":
+            self.frame_proxy = self.proxies.create(self._on_demand_frame)
+            self.invalidate_proxy = self.proxies.create(self.invalidate)
+            self.controls.addEventListener("change", self.invalidate_proxy)
+            self.invalidate()
+        elif self.render_mode == "hybrid":
+            cls = type(self)
+            if cls.animate is not SceneBase.animate or self.tick_rate is not None:
+                self.frame_proxy = self.proxies.create(self._advance)
+            interval = 1000 / self.animate_rate if self.animate_rate else 0
+            self.driver = loop.start(
+                self.renderer,
+                self.scene,
+                self.camera,
+                self.controls,
+                self.stats,
+                self.frame_proxy,
+                interval,
+            )
+        else:
+            self.frame_proxy = self.proxies.create(self._animate)
+            self.renderer.setAnimationLoop(self.frame_proxy)
+        if self.watchdog is not None:
+            self.watchdog.start(self.renderer)
         document.getElementById("stats").appendChild(self.stats.dom)
 
+    async def warmup(self, *scenes, loading_manager=None):
+        """Compile shader programs for the scene and any extra `scenes` now.
+
+        Otherwise every material compiles on the frame it's first drawn,
+        which shows as a hitch. Each scene is reported to `loading_manager`
+        as an item named "shaders:<scene name>". The time it all took is
+        stored in `warmup_ms`.
+
+        The camera, with the lights attached to it, visits each extra scene
+        while it compiles, so call this before `start()`.
+        """
+        self.attach()
+        camera = self.camera
+        home = camera.parent
+        start = perf_counter()
+        for scene in (self.scene,) + scenes:
+            item = f"shaders:{scene.name or scene.uuid}"
+            if loading_manager is not None:
+                loading_manager.itemStart(item)
+            scene.add(camera)
+            try:
+                await self.renderer.compileAsync(scene, camera)
+            finally:
+                if home is not None:
+                    home.add(camera)
+            if loading_manager is not None:
+                loading_manager.itemEnd(item)
+        self.warmup_ms = elapsed_ms(start, perf_counter())
+        print(f"Compiled shaders for {1 + len(scenes)} scene(s) in {self.warmup_ms:.1f}ms")
+        return self.warmup_ms
+
     def stop(self):
-        uniforms.call_with_null(self.renderer.setAnimationLoop)
+        """Stop rendering and destroy the proxies `start()` made."""
+        if not self.running:
+            return
+        self.running = False
+        if self.render_mode == "on_demand":
+            if self.frame_request:
+                window.cancelAnimationFrame(self.frame_request)
+                self.frame_request = 0
+            self.controls.removeEventListener("change", self.invalidate_proxy)
+            self.proxies.destroy(self.invalidate_proxy)
+            self.invalidate_proxy = None
+        else:
+            uniforms.call_with_null(self.renderer.setAnimationLoop)
+            self.driver = None
+        self.proxies.destroy(self.frame_proxy)
+        self.frame_proxy = None
+        if self.watchdog is not None:
+            self.watchdog.stop()
         document.getElementById("stats").replaceChildren()
 
+    def dispose(self):
+        """Tear the scene down for good.
+
+        Stops rendering, frees every geometry, material and texture in
+        the scene, releases the WebGL context, removes the split gutter
+        and destroys all proxies.
+        """
+        self.stop()
+        if self.attached:
+            window.removeEventListener("resize", self.resize_proxy)
+            self.resize_proxy = None
+            split = getattr(self.renderer, "split", None)
+            if split:
+                split.destroy()
+                self.renderer.split = None
+        self.proxies.destroy_all()
+        freed = resources.dispose_tree(self.scene)
+        self.scene.clear()
+        if self.attached:
+            self.attached = False
+            self.controls.dispose()
+            self.renderer.dispose()
+            # dispose() alone keeps the context until garbage collection,
+            # and browsers cap how many can be alive at once.
+            self.renderer.forceContextLoss()
+            self.renderer.domElement.remove()
+        return freed
+
+    def invalidate(self, event=None):
+        """Request a redraw of an on-demand scene on the next frame.
+
+        Cheap to call many times per frame, only one redraw gets scheduled.
+        Also marks shadows dirty. Otherwise in continuous mode this does nothing.
+        """
+        if self.shadows is not None:
+            self.shadows.mark_dirty()
+        if self.render_mode != "on_demand" or not self.running:
+            return
+        if self.frame_request:
+            return
+        self.frame_request = window.requestAnimationFrame(self.frame_proxy)
+
+    def _on_demand_frame(self, now=0.0):
+        self.frame_request = 0
+        if self.running:
+            # controls.update() emits "change" while damping is still
+            # settling, which schedules the next frame through invalidate().
+            self._animate(now)
+
     def animate(self, now, delta):
         # your logic goes here in sub-classes
         pass
 
+    def update(self, dt):
+        # fixed-step simulation logic goes here in sub-classes, `dt` is
+        # always `1 / tick_rate`; in `animate()` use `self.alpha` to blend
+        # between the previous and the current simulation state
+        pass
+
+    def _advance(self, now):
+        delta = self.clock.getDelta()
+        if self.tick_rate is not None:
+            self._fixed_steps(delta)
+        self.animate(now, delta)
+        self.commands.flush()
+
+    def _fixed_steps(self, delta):
+        step = 1 / self.tick_rate
+        accumulator = self.accumulator + delta
+        steps = 0
+        while accumulator >= step:
+            if steps == self.max_steps:
+                # Too far behind, catching up would only make the next
+                # frame slower still.
+                accumulator %= step
+                break
+            self.update(step)
+            accumulator -= step
+            steps += 1
+        self.accumulator = accumulator
+        self.alpha = accumulator / step
+
     def _animate(self, now=0.0):
-        self.controls.update()
-        self.animate(now, self.clock.getDelta())
+        if self.resolution is not None:
+            self.resolution.update(self.renderer, now)
+        if self.profiler is not None:
+            return self._animate_profiled(now)
+
+        moved = self.controls.update()
+        self._advance(now)
+        if self.shadows is not None:
+            self.shadows.before_render(self.renderer, now, moved)
+        self.renderer.render(self.scene, self.camera)
+        self.stats.update()
+        if self.telemetry is not None:
+            self.telemetry.sample(self.stats, self.renderer)
+
+    def _animate_profiled(self, now):
+        t0 = perf_counter()
+        moved = self.controls.update()
+        t1 = perf_counter()
+        self._advance(now)
+        t2 = perf_counter()
+        if self.shadows is not None:
+            self.shadows.before_render(self.renderer, now, moved)
         self.renderer.render(self.scene, self.camera)
+        t3 = perf_counter()
         self.stats.update()
+        t4 = perf_counter()
+        if self.telemetry is not None:
+            self.telemetry.sample(self.stats, self.renderer)
+        self.profiler.add_frame(
+            elapsed_ms(t0, t1),
+            elapsed_ms(t1, t2),
+            elapsed_ms(t2, t3),
+            elapsed_ms(t3, t4),
+        )
 
     def _on_window_resize(self, event):
         aspect_ratio = window.innerWidth / window.innerHeight
@@ -235,3 +1069,221 @@ class SceneBase:
         else:
             raise ValueError("Unknown camera type")
         renderer.setSize(window.innerWidth, window.innerHeight)
+        self.invalidate()
+
+
+@dataclass(fast_attrs=True)
+class SceneManager:
+    """Named scenes rendered by one SceneBase, switched without hitches.
+
+    Inactive scenes get their shader programs compiled, and their buffers,
+    textures and shadow maps uploaded, in browser idle time: one step per
+    idle period of at least `idle_slice_ms`, with shaders compiled in the
+    background by `compileAsync()`. At most `max_resident` scenes keep GPU
+    resources, the least recently active ones are evicted (three.js uploads
+    them again on next use). Eviction leaves alone whatever a resident
+    scene also uses, and `shared()` instances:
+
+        scenes = SceneManager(app=app)
+        scenes.add("grid", scene_grid)
+        scenes.add("knot", scene_knot)
+        scenes.activate("grid")
+
+    Call `scenes.dispose()` before `app.dispose()`.
+    """
+
+    # udataclasses can't see fields without a default, hence None
+    app: SceneBase = field(default=None)
+    max_resident: int = field(default=3)
+    scenes: dict = field(default_factory=dict)
+    active: str | None = field(default=None)
+    recent: list = field(default_factory=list)  # least recently active first
+    warm: list = field(default_factory=list)  # names with GPU resources
+    compiled: list = field(default_factory=list)  # names with shaders only
+    idle_slice_ms: float = field(default=8.0)
+    idle_proxy: object = field(init=False, repr=False, compare=False)
+    idle_request: int = field(init=False, repr=False, compare=False)
+    compile_task: object = field(init=False, repr=False, compare=False)
+    target: object = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.app is None:
+            raise TypeError("SceneManager needs the app=SceneBase(...) to render with")
+        self.idle_proxy = self.app.proxies.create(self._on_idle)
+        self.idle_request = 0
+        self.compile_task = None
+        self.target = None
+
+    def add(self, name, scene):
+        scene.name = name
+        self.scenes[name] = scene
+        self._schedule_idle()
+
+    def remove(self, name):
+        self.evict(name)
+        if name in self.recent:
+            self.recent.remove(name)
+        return self.scenes.pop(name)
+
+    def activate(self, name):
+        scene = self.scenes[name]
+        if name not in self.warm:
+            # Not pre-warmed yet, pay for it now rather than mid-frame.
+            self.warm_up(name)
+        scene.add(self.app.camera)
+        self.app.scene = scene
+        if self.app.driver is not None:
+            self.app.driver.scene = scene
+        self.active = name
+        if name in self.recent:
+            self.recent.remove(name)
+        self.recent.append(name)
+        self._evict_over_limit()
+        self._schedule_idle()
+        self.app.invalidate()
+
+    def warm_up(self, name):
+        """Compile and upload everything needed to draw scene `name`.
+
+        Runs synchronously so that the camera, and the lights attached to
+        it, can visit the scene without any frame seeing it missing.
+        """
+        app = self.app
+        scene = self.scenes[name]
+        camera = app.camera
+        home = camera.parent
+        scene.add(camera)
+        app.renderer.compile(scene, camera)
+        self._upload(scene)
+        if home is not None:
+            home.add(camera)
+        self._mark_warm(name)
+
+    def evict(self, name):
+        if name in self.compiled:
+            self.compiled.remove(name)
+        if name in self.warm:
+            self.warm.remove(name)
+            keep = [self.scenes[other] for other in self.warm]
+            if self.active is not None and self.active not in self.warm:
+                keep.append(self.scenes[self.active])
+            resources.dispose_unused(self.scenes[name], to_js(keep))
+
+    def _upload(self, scene):
+        # Drawing into a 1x1 target uploads buffers, textures and shadow maps.
+        renderer = self.app.renderer
+        if self.target is None:
+            self.target = new(THREE.WebGLRenderTarget, 1, 1)
+        renderer.setRenderTarget(self.target)
+        renderer.render(scene, self.app.camera)
+        uniforms.call_with_null(renderer.setRenderTarget)
+
+    def _mark_warm(self, name):
+        if name in self.compiled:
+            self.compiled.remove(name)
+        if name not in self.warm:
+            self.warm.append(name)
+        self._evict_over_limit()
+
+    def _evict_over_limit(self):
+        while len(self.warm) > self.max_resident:
+            victim = None
+            for name in self.recent + self.warm:
+                if name in self.warm and name != self.active:
+                    victim = name
+                    break
+            if victim is None:
+                return
+            self.evict(victim)
+
+    def _next_cold(self):
+        if len(self.warm) >= self.max_resident:
+            return None
+        # Most recently active first, then never-activated scenes.
+        for name in reversed(self.recent):
+            if name not in self.warm:
+                return name
+        for name in self.scenes:
+            if name not in self.warm and name not in self.recent:
+                return name
+        return None
+
+    def dispose(self):
+        """Cancel pending warm-ups, free the inactive scenes' GPU resources.
+
+        Call before `app.dispose()`, which frees the active scene and
+        destroys the proxy a pending idle callback would call.
+        """
+        if self.idle_request:
+            if hasattr(window, "cancelIdleCallback"):
+                window.cancelIdleCallback(self.idle_request)
+            else:
+                window.clearTimeout(self.idle_request)
+            self.idle_request = 0
+        if self.idle_proxy is not None:
+            self.app.proxies.destroy(self.idle_proxy)
+            self.idle_proxy = None
+        if self.compile_task is not None:
+            self.compile_task.cancel()
+            self.compile_task = None
+        keep = []
+        if self.active is not None:
+            keep.append(self.scenes[self.active])
+        keep = to_js(keep)
+        freed = 0
+        for name, scene in self.scenes.items():
+            if name != self.active:
+                freed += resources.dispose_unused(scene, keep)
+        self.warm = [name for name in self.warm if name == self.active]
+        self.compiled = []
+        if self.target is not None:
+            self.target.dispose()
+            self.target = None
+        return freed
+
+    def _schedule_idle(self):
+        if self.idle_request or self.idle_proxy is None or self.compile_task is not None:
+            return
+        if self._next_cold() is None:
+            return
+        if hasattr(window, "requestIdleCallback"):
+            self.idle_request = window.requestIdleCallback(self.idle_proxy)
+        else:
+            self.idle_request = window.setTimeout(self.idle_proxy, 100)
+
+    def _on_idle(self, deadline=None):
+        self.idle_request = 0
+        if deadline is not None and deadline.timeRemaining() < self.idle_slice_ms:
+            # Too little time left before the next frame, wait for a longer one.
+            self._schedule_idle()
+            return
+        name = self._next_cold()
+        if name is None:
+            return
+        app = self.app
+        scene = self.scenes[name]
+        camera = app.camera
+        home = camera.parent
+        scene.add(camera)
+        upload = name in self.compiled
+        if upload:
+            self._upload(scene)
+        else:
+            # Only creating the programs blocks, the camera can go back
+            # before they finish compiling.
+            promise = app.renderer.compileAsync(scene, camera)
+            self.compile_task = asyncio.ensure_future(self._compiled(name, promise))
+        if home is not None:
+            home.add(camera)
+        if upload:
+            self._mark_warm(name)
+            self._schedule_idle()
+
+    async def _compiled(self, name, promise):
+        try:
+            await promise
+        finally:
+            self.compile_task = None
+        if name in self.scenes and name not in self.warm and name not in self.compiled:
+            self.compiled.append(name)
+        self._schedule_idle()
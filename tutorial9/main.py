@@ -11,7 +11,7 @@ from pyscript import config
 from pyscript.ffi import create_proxy
 
 from libthree import THREE, new, clear, dataclass, field
-from libthree import SceneBase, GLTFLoader, get_loading_manager
+from libthree import SceneBase, GLTFLoader, get_loading_manager, bind
 
 MICROPYTHON = config["type"] == "mpy"
 
@@ -27,6 +27,7 @@ class GLTFModels(SceneBase):
     point_light: THREE.PointLight = field(init=False)
     spot_light: THREE.SpotLight = field(init=False)
     python_logo: THREE.Mesh | None = field(default=None)
+    python_logo_rotation: THREE.Euler | None = field(default=None)
     flamingo: THREE.Mesh | None = field(default=None)
     flamingo_clips: list[THREE.AnimationClip] | None = field(default=None)
     flamingo_animation: THREE.AnimationMixer | None = field(default=None)
@@ -38,7 +39,7 @@ class GLTFModels(SceneBase):
     def __post_init__(self):
         super().__post_init__()
 
-        self.loading_manager, self.loaded_event = get_loading_manager()
+        self.loading_manager, self.loaded_event = get_loading_manager(proxies=self.proxies)
         self.texture_loader = new(THREE.TextureLoader, self.loading_manager)
         self.gltf_loader = new(GLTFLoader, self.loading_manager)
 
@@ -60,12 +61,12 @@ class GLTFModels(SceneBase):
 
         self.gltf_loader.load(
             'assets/python/scene.gltf',
-            create_proxy(self.python_logo_callback),
+            self.proxies.create(self.python_logo_callback),
         )
 
         self.gltf_loader.load(
             'assets/flamingo.glb',
-            create_proxy(self.flamingo_callback),
+            self.proxies.create(self.flamingo_callback),
         )
 
         self.controls._dollyIn(2)
@@ -74,6 +75,7 @@ class GLTFModels(SceneBase):
         self.python_logo = gltf.scene
         self.python_logo.scale.set(0.2, 0.2, 0.2)
         self.python_logo.name = "Python logo"
+        self.python_logo_rotation = bind(self.python_logo, "rotation")
         await self.renderer.compileAsync(self.python_logo, self.camera, self.scene)
         self.scene.add(self.python_logo)
 
@@ -90,9 +92,10 @@ class GLTFModels(SceneBase):
         self.scene.add(self.flamingo)
     
     def animate(self, now, delta):
-        if self.python_logo:
-            self.python_logo.rotation.x = now / 1000
-            self.python_logo.rotation.y = now / 2000
+        rotation = self.python_logo_rotation
+        if rotation:
+            rotation.x = now / 1000
+            rotation.y = now / 2000
         if self.flamingo_animation:
             self.flamingo_animation.update(delta)                
 
@@ -118,5 +121,6 @@ document.addEventListener("keydown", on_key_down)
 app = GLTFModels()
 
 await app.loaded_event.wait()
+await app.warmup()
 
 app.start()